@@ -16,20 +16,33 @@ def main() -> None:
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
 
-    if len(sys.argv) < 2:
+    args = sys.argv[1:]
+    use_text_cache = "--no-cache" not in args
+    pipeline_parallel = "--pipeline-parallel" in args
+    args = [
+        arg for arg in args if arg not in {"--no-cache", "--pipeline-parallel"}
+    ]
+
+    if not args:
         logger.error(
             "Usage: python -m scripts.run_agents "
-            "<path_or_url_to_article.(pdf|txt|md)>"
+            "[--no-cache] [--pipeline-parallel] "
+            "<path_or_url_to_article.(pdf|txt|md)> [more sources ...]"
         )
         sys.exit(1)
 
-    raw_source = sys.argv[1]
-
     sample_manager = ArticleSampleManager(samples_dir="samples")
-    runner = ArticlePipelineRunner(sample_manager=sample_manager)
+    runner = ArticlePipelineRunner(
+        sample_manager=sample_manager,
+        use_text_cache=use_text_cache,
+        pipeline_parallel=pipeline_parallel,
+    )
 
     try:
-        runner.run_for_source(raw_source)
+        if len(args) == 1:
+            runner.run_for_source(args[0])
+        else:
+            runner.run_for_sources(args)
     except Exception as e:
         logger.error("Pipeline failed: %s", e)
         sys.exit(1)
@@ -0,0 +1,45 @@
+# src/mcp_server/_config.py
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict
+import logging
+
+import yaml
+
+try:
+    # C-backed loader (libyaml) is ~10x faster than the pure-Python one.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+CONFIG_PATH = ROOT_DIR / "configuration" / "base.yaml"
+
+
+@lru_cache(maxsize=2)
+def _load_config_at(mtime_ns: int) -> Dict[str, Any]:
+    logger.debug("Loading configuration from: %s", CONFIG_PATH)
+    with CONFIG_PATH.open("r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+def load_config() -> Dict[str, Any]:
+    """
+    Load and cache `configuration/base.yaml`.
+
+    Keyed by the file's mtime, so the cost per call is one stat: the YAML
+    is parsed once per process and re-parsed only if the file changes.
+    Every module that needs the raw configuration should import this
+    instead of re-reading the YAML.
+    """
+    try:
+        mtime_ns = CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        logger.error("Configuration file not found: %s", CONFIG_PATH)
+        raise FileNotFoundError(f"Configuration file not found: {CONFIG_PATH}")
+
+    return _load_config_at(mtime_ns)
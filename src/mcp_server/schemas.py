@@ -29,6 +29,11 @@ class SearchArticlesResponse(BaseModel):
     results: List[ArticleSummary]
 
 
+class SearchArticlesBatchResponse(BaseModel):
+    """Response for the /search_articles_batch endpoint, one entry per query."""
+    results: List[SearchArticlesResponse]
+
+
 class GetArticleContentRequest(BaseModel):
     """Payload sent by clients when requesting the full content of an article."""
     article_id: str
@@ -1,12 +1,13 @@
 # src/mcp_server/server.py
 from __future__ import annotations
 
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any, Dict
 import sys
 import logging
 
-import yaml
+import anyio.to_thread
 from fastmcp import FastMCP
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
@@ -14,21 +15,17 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from src.vector_database.vector_database import VectorDatabase
+from src.mcp_server._config import load_config
 from src.mcp_server.schemas import (
     SearchArticlesResponse,
+    SearchArticlesBatchResponse,
     ArticleSummary,
     ArticleContent,
 )
 
 logger = logging.getLogger(__name__)
 
-CONFIG_PATH = ROOT_DIR / "configuration" / "base.yaml"
-
-if not CONFIG_PATH.exists():
-    raise FileNotFoundError(f"Configuration file not found: {CONFIG_PATH}")
-
-with CONFIG_PATH.open("r", encoding="utf-8") as f:
-    config: Dict[str, Any] = yaml.safe_load(f) or {}
+config: Dict[str, Any] = load_config()
 
 mcp_cfg: Dict[str, Any] = config.get("mcp", {}) or {}
 paths_cfg: Dict[str, Any] = config.get("paths", {}) or {}
@@ -49,24 +46,46 @@ EMBEDDING_MODEL: str = vdb_cfg.get(
     "embedding_model",
     "sentence-transformers/all-MiniLM-L6-v2",
 )
+EMBEDDING_BACKEND: str = vdb_cfg.get("embedding_backend", "torch")
 COLLECTION_NAME: str = vdb_cfg.get("collection_name", "articles")
 CHUNK_SIZE: int = int(vdb_cfg.get("chunk_size", 1000))
 CHUNK_OVERLAP: int = int(vdb_cfg.get("chunk_overlap", 200))
+HNSW_M: int = int(vdb_cfg.get("hnsw_m", 24))
+HNSW_EF_CONSTRUCTION: int = int(vdb_cfg.get("hnsw_ef_construction", 128))
+HNSW_EF_SEARCH: int = int(vdb_cfg.get("hnsw_ef_search", 100))
 
 vector_db = VectorDatabase(
     pdf_root_path=PDF_ROOT,
     chroma_path=CHROMA_PATH,
     embedding_model=EMBEDDING_MODEL,
+    embedding_backend=EMBEDDING_BACKEND,
     collection_name=COLLECTION_NAME,
     chunk_size=CHUNK_SIZE,
     chunk_overlap=CHUNK_OVERLAP,
+    hnsw_m=HNSW_M,
+    hnsw_ef_construction=HNSW_EF_CONSTRUCTION,
+    hnsw_ef_search=HNSW_EF_SEARCH,
 )
 
 mcp = FastMCP(name=MCP_NAME)
 
 
+@lru_cache(maxsize=1024)
+def _cached_search(query: str, top_k: int) -> tuple[tuple[tuple[str, Any], ...], ...]:
+    """
+    Memoized wrapper around VectorDatabase.search_articles.
+
+    Repeated queries (agent retries, tool-calling loops) dominate traffic,
+    and re-embedding the query is the expensive part. Results are frozen as
+    tuples so they are hashable/cacheable; the cache lives for the process
+    lifetime, so restart the server after re-ingesting the database.
+    """
+    results = vector_db.search_articles(query=query, top_k=top_k)
+    return tuple(tuple(item.items()) for item in results)
+
+
 @mcp.tool
-def search_articles(query: str, top_k: int = 5) -> SearchArticlesResponse:
+async def search_articles(query: str, top_k: int = 5) -> SearchArticlesResponse:
     logger.info(
         "search_articles called | query_length=%d | top_k=%d",
         len(query),
@@ -74,21 +93,58 @@ def search_articles(query: str, top_k: int = 5) -> SearchArticlesResponse:
     )
 
     try:
-        raw_results = vector_db.search_articles(query=query, top_k=top_k)
+        # Embedding + vector query are CPU-bound; offload to a worker
+        # thread so the event loop can keep serving other requests.
+        raw_pairs = await anyio.to_thread.run_sync(
+            partial(_cached_search, query, top_k)
+        )
+        raw_results = [dict(pairs) for pairs in raw_pairs]
     except Exception as e:
         logger.exception("Failed to search articles.")
         raise RuntimeError(str(e)) from e
 
-    summaries = [ArticleSummary(**item) for item in raw_results]
-    return SearchArticlesResponse(results=summaries)
+    # The results come from our own VectorDatabase and already have the
+    # right shape and types, so skip full Pydantic validation.
+    summaries = [ArticleSummary.model_construct(**item) for item in raw_results]
+    return SearchArticlesResponse.model_construct(results=summaries)
+
+
+@mcp.tool
+async def search_articles_batch(
+    queries: list[str],
+    top_k: int = 5,
+) -> SearchArticlesBatchResponse:
+    logger.info(
+        "search_articles_batch called | n_queries=%d | top_k=%d",
+        len(queries),
+        top_k,
+    )
+
+    try:
+        raw_batches = await anyio.to_thread.run_sync(
+            partial(vector_db.search_articles_batch, queries=queries, top_k=top_k)
+        )
+    except Exception as e:
+        logger.exception("Failed to batch-search articles.")
+        raise RuntimeError(str(e)) from e
+
+    responses = [
+        SearchArticlesResponse.model_construct(
+            results=[ArticleSummary.model_construct(**item) for item in batch]
+        )
+        for batch in raw_batches
+    ]
+    return SearchArticlesBatchResponse.model_construct(results=responses)
 
 
 @mcp.tool
-def get_article_content(article_id: str) -> ArticleContent:
+async def get_article_content(article_id: str) -> ArticleContent:
     logger.info("get_article_content called | article_id=%s", article_id)
 
     try:
-        article = vector_db.get_article_content(article_id=article_id)
+        article = await anyio.to_thread.run_sync(
+            partial(vector_db.get_article_content, article_id=article_id)
+        )
     except KeyError as e:
         logger.warning("Article not found: %s", article_id)
         raise ValueError("Article not found") from e
@@ -96,7 +152,9 @@ def get_article_content(article_id: str) -> ArticleContent:
         logger.exception("Failed to retrieve article content.")
         raise RuntimeError(str(e)) from e
 
-    return ArticleContent(**article)
+    # The dict already matches the schema; validating the multi-KB content
+    # string again before serialization is measurable overhead.
+    return ArticleContent.model_construct(**article)
 
 
 if __name__ == "__main__":
@@ -119,4 +177,12 @@ if __name__ == "__main__":
         host=MCP_HOST,
         port=MCP_PORT,
         path=MCP_PATH,
+        # FastMCP serves over uvicorn; "auto" picks the uvloop event loop
+        # and httptools parser when installed (both are in requirements),
+        # and dropping per-request access logging is a large win under load.
+        uvicorn_config={
+            "loop": "auto",
+            "http": "auto",
+            "access_log": False,
+        },
     )
@@ -0,0 +1,26 @@
+# src/multi_agent_system/_llm.py
+from __future__ import annotations
+
+from functools import lru_cache
+import logging
+
+from langchain_groq import ChatGroq
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4)
+def get_chat_groq(model: str, temperature: float) -> ChatGroq:
+    """
+    Build (or reuse) a ChatGroq client for the given settings.
+
+    Agents with identical (model, temperature) share one client — and thus
+    one underlying HTTP connection pool — instead of each constructing
+    their own.
+    """
+    logger.debug(
+        "Building shared ChatGroq client with model=%s, temperature=%s",
+        model,
+        temperature,
+    )
+    return ChatGroq(model=model, temperature=temperature)
@@ -0,0 +1,78 @@
+# src/multi_agent_system/_result_cache.py
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Optional
+import hashlib
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Set to a truthy value ("1", "true", ...) to bypass agent result caching,
+# e.g. in tests that assert on per-call LLM traffic.
+DISABLE_ENV_VAR = "MULTI_AGENT_DISABLE_RESULT_CACHE"
+
+
+def result_cache_enabled() -> bool:
+    """Whether agent-level result caching is enabled for this process."""
+    value = os.environ.get(DISABLE_ENV_VAR, "").strip().lower()
+    return value not in {"1", "true", "yes", "on"}
+
+
+def article_cache_key(text: str, max_tokens: int, extra: str = "") -> str:
+    """
+    Stable cache key for an article payload.
+
+    Only the prefix that survives token truncation matters for the agents,
+    so hashing a bounded prefix (~4 chars/token upper bound) keeps the key
+    cheap on very large articles. `extra` folds in any additional inputs
+    that change the LLM request (e.g. the classified area).
+    """
+    prefix = text[: max_tokens * 4]
+    digest = hashlib.blake2b(digest_size=16)
+    if extra:
+        digest.update(extra.encode("utf-8"))
+        digest.update(b"\x00")
+    digest.update(prefix.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Tiny LRU mapping cache keys to agent outputs.
+
+    functools.lru_cache does not fit here because the cached value is
+    derived from an unhashable state dict; this keeps the same bounded-LRU
+    semantics with an explicit get/put API.
+
+    The agent singletons (and therefore their caches) are shared across
+    the pipeline's worker threads, so lookup + move_to_end and
+    insert + evict each happen under a lock.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,69 @@
+# src/multi_agent_system/_tokenization.py
+from __future__ import annotations
+
+from functools import lru_cache
+import logging
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODING = "cl100k_base"
+
+
+@lru_cache(maxsize=4)
+def get_encoder(encoding_name: str = DEFAULT_ENCODING) -> tiktoken.Encoding:
+    """Return a cached tiktoken encoder; `get_encoding` is not free per call."""
+    return tiktoken.get_encoding(encoding_name)
+
+
+def truncate_by_tokens(
+    text: str,
+    max_tokens: int,
+    encoding_name: str = DEFAULT_ENCODING,
+    strict_tokens: bool = False,
+) -> str:
+    """
+    Truncate `text` to roughly `max_tokens` tokens.
+
+    This is the single hot path shared by all agents. A character-count
+    preflight skips tokenization entirely for short texts, and the default
+    (non-strict) path truncates with a character slice since the LLM
+    re-tokenizes server-side anyway. Pass `strict_tokens=True` when exact
+    token bounds are required.
+    """
+    if not text:
+        return ""
+
+    max_tokens = int(max_tokens)
+    if max_tokens <= 0:
+        return ""
+
+    if not strict_tokens:
+        # cl100k_base averages ~3-4 chars per token on prose, so a text
+        # within max_tokens * 2 chars is safely under the cap. This is an
+        # approximation (CJK-heavy text runs closer to a token per char),
+        # which is fine here: the non-strict path is approximate by
+        # contract. Slicing always copies in CPython; only pay for it
+        # (and the trailing-word trim) when the text exceeds the cap.
+        n = len(text)
+        if n <= max_tokens * 2:
+            return text
+        limit = int(max_tokens * 3.5)
+        if n <= limit:
+            return text
+        return text[:limit].rsplit(" ", 1)[0]
+
+    # Strict preflight must be sound for any script, so bound by bytes:
+    # a BPE token always covers at least one byte, so the token count can
+    # never exceed the UTF-8 byte length.
+    if len(text.encode("utf-8")) <= max_tokens:
+        return text
+
+    enc = get_encoder(encoding_name)
+    tokens = enc.encode_ordinary(text)
+
+    if len(tokens) <= max_tokens:
+        return text
+
+    return enc.decode(tokens[:max_tokens])
@@ -1,48 +1,107 @@
 # src/multi_agent_system/classifier_agent.py
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List
+import asyncio
 import logging
 import json
+import os
 
-import tiktoken
 from langchain_groq import ChatGroq
 from langchain_core.messages import SystemMessage, HumanMessage, ToolMessage
 
-from ..config_loader import MultiAgentConfig
+from .._llm import get_chat_groq
+from .._result_cache import ResultCache, article_cache_key, result_cache_enabled
+from .._tokenization import truncate_by_tokens
+from ..config_loader import MultiAgentConfig, get_config
 from ..mcp_vector_client import MCPVectorStoreClient
 
-logger = logging.getLogger(__name__)
+try:
+    # Optional fast JSON serializer for tool results handed back to the LLM
+    import orjson
 
-ROOT_DIR = Path(__file__).resolve().parents[2]
-PDF_ROOT = ROOT_DIR / "pdf_database"
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    _ORJSON_AVAILABLE = False
 
-_mcp_client_singleton = MCPVectorStoreClient()
+try:
+    # Optional C-accelerated fuzzy matching; makes area normalization
+    # robust to typos in the LLM output without a pure-Python scan.
+    from rapidfuzz import fuzz, process
+
+    _RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    fuzz = process = None
+    _RAPIDFUZZ_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
 
-def _truncate_by_tokens(text: str, max_tokens: int, encoding_name: str) -> str:
-    if not text:
-        return ""
 
-    max_tokens = int(max_tokens)
-    if max_tokens <= 0:
-        return ""
+def _dumps(obj: Any) -> str:
+    if _ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
 
-    enc = tiktoken.get_encoding(encoding_name)
-    tokens = enc.encode(text)
+ROOT_DIR = Path(__file__).resolve().parents[2]
+PDF_ROOT = ROOT_DIR / "pdf_database"
 
-    if len(tokens) <= max_tokens:
-        return text
+_mcp_client_singleton = MCPVectorStoreClient()
 
-    return enc.decode(tokens[:max_tokens])
+# Shared pool for the speculative no-tool classification issued while tool
+# calls execute; module-level so run() never blocks on executor shutdown.
+_speculative_executor = ThreadPoolExecutor(
+    max_workers=2,
+    thread_name_prefix="classifier-speculative",
+)
+
+
+@lru_cache(maxsize=8)
+def _candidate_lookup(
+    candidates: tuple[str, ...],
+) -> tuple[Dict[str, str], List[tuple[str, str]], str | None]:
+    """
+    Memoized lookup structures for a candidate area tuple.
+
+    Returns (exact, pairs, econ_match): a lowercase→original dict for O(1)
+    exact matching, the (lowercase, original) pairs for substring scans,
+    and the first candidate starting with "econ" (or None). Built once per
+    distinct candidate set, so normalization allocates no strings per call.
+    """
+    pairs = [(c.lower(), c) for c in candidates]
+    exact = {lowered: original for lowered, original in pairs}
+    econ_match = next(
+        (original for lowered, original in pairs if lowered.startswith("econ")),
+        None,
+    )
+    return exact, pairs, econ_match
+
+
+# (mtime, areas) for PDF_ROOT; adding or removing an area directory bumps
+# the parent mtime, so a single stat per call decides whether the cached
+# listing is still valid — cheaper than a rescan, fresher than lru_cache.
+_areas_cache: tuple[float, List[str]] | None = None
 
 
-@lru_cache(maxsize=1)
 def get_available_areas() -> List[str]:
-    areas = sorted(d.name for d in PDF_ROOT.iterdir() if d.is_dir())
+    global _areas_cache
+
+    mtime = os.stat(PDF_ROOT).st_mtime
+    if _areas_cache is not None and _areas_cache[0] == mtime:
+        return _areas_cache[1]
+
+    # os.scandir returns DirEntry objects whose is_dir() uses the type
+    # reported by the directory read itself, avoiding a stat per child.
+    with os.scandir(PDF_ROOT) as entries:
+        areas = sorted(
+            entry.name
+            for entry in entries
+            if entry.is_dir(follow_symlinks=False)
+        )
 
     if not areas:
         logger.warning(
@@ -53,6 +112,7 @@ def get_available_areas() -> List[str]:
         return ["error while loading areas from pdf database"]
 
     logger.info("Discovered areas from pdf_database: %s", areas)
+    _areas_cache = (mtime, areas)
     return areas
 
 
@@ -62,7 +122,33 @@ class ClassifierAgent:
     mcp_query_tokens: int = 1500
     token_encoding: str = "cl100k_base"
 
-    _cfg: MultiAgentConfig = field(default_factory=MultiAgentConfig, init=False)
+    _cfg: MultiAgentConfig = field(default_factory=get_config, init=False)
+    _llm: ChatGroq | None = field(default=None, init=False, repr=False)
+    _llm_with_tools: Any = field(default=None, init=False, repr=False)
+    _system_prompt: str | None = field(default=None, init=False, repr=False)
+    _result_cache: ResultCache = field(
+        default_factory=ResultCache, init=False, repr=False
+    )
+
+    def _cached_area(self, article_text: str) -> tuple[str | None, str | None]:
+        """
+        Look up a previously computed area for this article.
+
+        Returns (cache_key, cached_area); both are None when caching is
+        disabled via MULTI_AGENT_DISABLE_RESULT_CACHE, and cached_area is
+        None on a miss. A hit skips the whole LLM+MCP round-trip.
+        """
+        if not result_cache_enabled():
+            return None, None
+
+        cache_key = article_cache_key(article_text, self.max_article_tokens)
+        area = self._result_cache.get(cache_key)
+        if area is not None:
+            logger.info(
+                "Classifier result cache hit (key=%s); skipping LLM call.",
+                cache_key,
+            )
+        return cache_key, area
 
     def _build_llm(self) -> ChatGroq:
         llm_cfg = self._cfg.get_llm_config()
@@ -75,7 +161,7 @@ class ClassifierAgent:
             temperature,
         )
 
-        return ChatGroq(model=model, temperature=temperature)
+        return get_chat_groq(model, temperature)
 
     @staticmethod
     def _normalize_area(raw: str, candidates: List[str]) -> str:
@@ -84,18 +170,28 @@ class ClassifierAgent:
             logger.warning("No candidate areas provided; defaulting to 'tech'.")
             return "tech"
 
-        for c in candidates:
-            if raw == c.lower():
-                return c
+        exact, pairs, econ_match = _candidate_lookup(tuple(candidates))
 
-        for c in candidates:
-            if c.lower() in raw:
-                return c
+        # Exact match is the overwhelmingly common outcome: one dict probe.
+        hit = exact.get(raw)
+        if hit is not None:
+            return hit
 
-        if "econ" in raw:
-            for c in candidates:
-                if c.lower().startswith("econ"):
-                    return c
+        if _RAPIDFUZZ_AVAILABLE:
+            # WRatio covers substrings, prefixes and typos in one C-level
+            # pass, so no separate "econ" special case is needed.
+            match = process.extractOne(
+                raw, exact.keys(), scorer=fuzz.WRatio, score_cutoff=60
+            )
+            if match is not None:
+                return exact[match[0]]
+        else:
+            for lowered, original in pairs:
+                if lowered in raw:
+                    return original
+
+            if econ_match is not None and "econ" in raw:
+                return econ_match
 
         logger.warning(
             "Could not confidently map raw area '%s' to known areas %s; "
@@ -106,21 +202,52 @@ class ClassifierAgent:
         )
         return candidates[0]
 
-    def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        article_text: str = state["article_text"]
-
-        logger.info(
-            "Classifier agent started. Article length=%d chars",
-            len(article_text),
+    @staticmethod
+    def _execute_search_call(
+        call: Dict[str, Any],
+        default_query: str,
+    ) -> tuple[ToolMessage, bool]:
+        """Execute one search_articles tool call and wrap it as a ToolMessage."""
+        args = call.get("args") or {}
+        call_id = call.get("id") or "search_articles_call"
+
+        query = args.get("query", default_query)
+        top_k = int(args.get("top_k", 5))
+
+        logger.info("Executing tool call: search_articles(top_k=%d)", top_k)
+        results = _mcp_client_singleton.search_articles({"query": query, "top_k": top_k})
+
+        tool_msg = ToolMessage(
+            content=_dumps(results),
+            tool_call_id=call_id,
         )
-
-        article_for_llm = _truncate_by_tokens(
+        return tool_msg, bool(results)
+
+    def _ensure_llm(self) -> Any:
+        """
+        Lazily build the LLM client once per agent instance; ChatGroq
+        construction and bind_tools both carry per-call overhead and a
+        cached client keeps HTTP connections alive across runs.
+        """
+        if self._llm_with_tools is None:
+            self._llm = self._build_llm()
+            self._llm_with_tools = self._llm.bind_tools(
+                [_mcp_client_singleton.search_articles]
+            )
+        return self._llm_with_tools
+
+    def _prepare_messages(
+        self,
+        article_text: str,
+    ) -> tuple[List[Any], List[str], str]:
+        """Build the first-pass transcript; returns (messages, candidates, query)."""
+        article_for_llm = truncate_by_tokens(
             article_text,
             max_tokens=self.max_article_tokens,
             encoding_name=self.token_encoding,
         )
 
-        query_for_mcp = _truncate_by_tokens(
+        query_for_mcp = truncate_by_tokens(
             article_text,
             max_tokens=self.mcp_query_tokens,
             encoding_name=self.token_encoding,
@@ -128,12 +255,12 @@ class ClassifierAgent:
 
         candidates = get_available_areas()
 
-        system_prompt = self._cfg.get_prompt("classifier")
-        llm = self._build_llm()
-        llm_with_tools = llm.bind_tools([_mcp_client_singleton.search_articles])
+        # The prompt is static for the process lifetime; fetch it once.
+        if self._system_prompt is None:
+            self._system_prompt = self._cfg.get_prompt("classifier")
 
         messages: List[Any] = [
-            SystemMessage(content=system_prompt),
+            SystemMessage(content=self._system_prompt),
             HumanMessage(
                 content=(
                     "You are classifying the scientific area of the paper.\n"
@@ -149,6 +276,49 @@ class ClassifierAgent:
                 )
             ),
         ]
+        return messages, candidates, query_for_mcp
+
+    @staticmethod
+    def _select_search_calls(tool_calls: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        for call in tool_calls:
+            if call.get("name") != "search_articles":
+                logger.warning("Ignoring unexpected tool call name=%s", call.get("name"))
+        return [c for c in tool_calls if c.get("name") == "search_articles"]
+
+    def _finalize(
+        self,
+        final: Any,
+        candidates: List[str],
+        state: Dict[str, Any],
+        cache_key: str | None = None,
+    ) -> Dict[str, Any]:
+        raw_area = (final.content or "").strip()
+        area = self._normalize_area(raw_area, candidates)
+
+        logger.info(
+            "Classifier LLM raw output='%s' mapped to area='%s' (candidates=%s)",
+            raw_area,
+            area,
+            candidates,
+        )
+        if cache_key is not None:
+            self._result_cache.put(cache_key, area)
+        return {**state, "area": area}
+
+    def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        article_text: str = state["article_text"]
+
+        logger.info(
+            "Classifier agent started. Article length=%d chars",
+            len(article_text),
+        )
+
+        cache_key, cached_area = self._cached_area(article_text)
+        if cached_area is not None:
+            return {**state, "area": cached_area}
+
+        llm_with_tools = self._ensure_llm()
+        messages, candidates, query_for_mcp = self._prepare_messages(article_text)
 
         logger.info("Sending classification request to LLM (tool-calling enabled).")
         first = llm_with_tools.invoke(messages)
@@ -157,65 +327,250 @@ class ClassifierAgent:
 
         # If the model chooses NOT to call tools, we accept its choice and use its content directly.
         if not tool_calls:
-            raw_area = (first.content or "").strip()
-            area = self._normalize_area(raw_area, candidates)
+            return self._finalize(first, candidates, state, cache_key)
+
+        # If the model DOES call tools, we execute them and do a second pass.
+        # Speculatively classify without tool context in parallel with the
+        # tool execution. If the tool returns nothing useful (or the second
+        # pass fails), we finalize from this answer instead of paying
+        # another serial LLM round-trip; otherwise it is discarded.
+        speculative_future = _speculative_executor.submit(self._llm.invoke, messages)
+
+        search_calls = self._select_search_calls(tool_calls)
+
+        # The prompt restricts the model to a single search, so only the
+        # first search_articles call is executed.
+        tool_msgs: List[ToolMessage] = []
+        got_tool_results = False
+        if search_calls:
+            tool_msg, got_tool_results = self._execute_search_call(
+                search_calls[0], query_for_mcp
+            )
+            tool_msgs = [tool_msg]
 
+        # Rebuild the transcript in a single allocation instead of growing
+        # the original list append-by-append.
+        messages = [*messages, first, *tool_msgs]
+
+        if not got_tool_results:
             logger.info(
-                "Classifier returned without tool call. raw='%s' mapped='%s' (candidates=%s)",
-                raw_area,
-                area,
-                candidates,
+                "Tool calls produced no results; using speculative "
+                "no-tool classification instead of a second LLM pass."
             )
+            final = speculative_future.result()
+        else:
+            logger.debug("Sending second pass to LLM to output ONLY the final area.")
+            try:
+                final = llm_with_tools.invoke(messages)
+            except Exception:
+                logger.exception(
+                    "Second classification pass failed; falling back to the "
+                    "speculative no-tool answer."
+                )
+                final = speculative_future.result()
 
-            new_state = dict(state)
-            new_state["area"] = area
-            return new_state
+        return self._finalize(final, candidates, state, cache_key)
 
-        # If the model DOES call tools, we execute them and do a second pass.
-        messages.append(first)
+    async def arun(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async variant of `run` built on `ainvoke` and the async MCP client,
+        so concurrent pipelines overlap their LLM/MCP round-trips instead of
+        blocking the event loop.
+        """
+        article_text: str = state["article_text"]
 
-        for call in tool_calls:
-            name = call.get("name")
-            args = call.get("args") or {}
-            call_id = call.get("id") or "search_articles_call"
+        logger.info(
+            "Classifier agent started (async). Article length=%d chars",
+            len(article_text),
+        )
 
-            if name != "search_articles":
-                logger.warning("Ignoring unexpected tool call name=%s", name)
-                continue
+        cache_key, cached_area = self._cached_area(article_text)
+        if cached_area is not None:
+            return {**state, "area": cached_area}
+
+        llm_with_tools = self._ensure_llm()
+        messages, candidates, query_for_mcp = self._prepare_messages(article_text)
+
+        # Prefetch the MCP search for the default snippet concurrently with
+        # the first LLM pass. If the model later calls the tool without a
+        # query of its own, the result is already in flight, which removes
+        # one HTTP round-trip from the critical path.
+        prefetch_task = asyncio.ensure_future(
+            _mcp_client_singleton.search_articles_async(query=query_for_mcp, top_k=5)
+        )
 
-            query = args.get("query", query_for_mcp)
-            top_k = int(args.get("top_k", 5))
+        logger.info("Sending classification request to LLM (tool-calling enabled).")
+        first = await llm_with_tools.ainvoke(messages)
+
+        return await self._afinish(
+            first,
+            messages,
+            candidates,
+            query_for_mcp,
+            state,
+            cache_key,
+            prefetch_task=prefetch_task,
+        )
+
+    async def _afinish(
+        self,
+        first: Any,
+        messages: List[Any],
+        candidates: List[str],
+        query_for_mcp: str,
+        state: Dict[str, Any],
+        cache_key: str | None = None,
+        prefetch_task: "asyncio.Task | None" = None,
+    ) -> Dict[str, Any]:
+        """
+        Continue an async classification after the first LLM pass: execute
+        any tool call, run the second pass with a speculative fallback, and
+        finalize the area. Shared by `arun` and `run_many`.
+        """
+        tool_calls = getattr(first, "tool_calls", None) or []
+
+        if not tool_calls:
+            if prefetch_task is not None:
+                prefetch_task.cancel()
+            return self._finalize(first, candidates, state, cache_key)
+
+        # Speculative no-tool classification runs concurrently with the
+        # tool call, same as the sync path but on the event loop.
+        speculative_task = asyncio.ensure_future(self._llm.ainvoke(messages))
+
+        search_calls = self._select_search_calls(tool_calls)
+
+        tool_msgs: List[ToolMessage] = []
+        got_tool_results = False
+        if search_calls:
+            tool_msg, got_tool_results = await self._execute_search_call_async(
+                search_calls[0], query_for_mcp, prefetch=prefetch_task
+            )
+            tool_msgs = [tool_msg]
+        elif prefetch_task is not None:
+            prefetch_task.cancel()
 
-            logger.info("Executing tool call: search_articles(top_k=%d)", top_k)
-            results = _mcp_client_singleton.search_articles({"query": query, "top_k": top_k})
+        messages = [*messages, first, *tool_msgs]
 
-            messages.append(
-                ToolMessage(
-                    content=json.dumps(results, ensure_ascii=False),
-                    tool_call_id=call_id,
+        if not got_tool_results:
+            logger.info(
+                "Tool calls produced no results; using speculative "
+                "no-tool classification instead of a second LLM pass."
+            )
+            final = await speculative_task
+        else:
+            logger.debug("Sending second pass to LLM to output ONLY the final area.")
+            try:
+                final = await self._llm_with_tools.ainvoke(messages)
+            except Exception:
+                logger.exception(
+                    "Second classification pass failed; falling back to the "
+                    "speculative no-tool answer."
                 )
+                final = await speculative_task
+            else:
+                speculative_task.cancel()
+
+        return self._finalize(final, candidates, state, cache_key)
+
+    async def run_many(self, states: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Classify several articles with one batched first-pass LLM call.
+
+        `abatch` lets the provider handle the first passes concurrently
+        instead of N sequential round-trips; articles whose first pass
+        requests the search tool finish concurrently via `_afinish`.
+        Result-cache hits skip the batch entirely.
+        """
+        results: List[Dict[str, Any] | None] = [None] * len(states)
+        pending: List[tuple[int, str | None, List[Any], List[str], str]] = []
+
+        for i, state in enumerate(states):
+            cache_key, cached_area = self._cached_area(state["article_text"])
+            if cached_area is not None:
+                results[i] = {**state, "area": cached_area}
+                continue
+            messages, candidates, query_for_mcp = self._prepare_messages(
+                state["article_text"]
             )
+            pending.append((i, cache_key, messages, candidates, query_for_mcp))
 
-        logger.debug("Sending second pass to LLM to output ONLY the final area.")
-        final = llm_with_tools.invoke(messages)
-        raw_area = (final.content or "").strip()
+        if pending:
+            llm_with_tools = self._ensure_llm()
+            max_concurrency = int(
+                self._cfg.get_llm_config().get("max_concurrency", 8)
+            )
 
-        area = self._normalize_area(raw_area, candidates)
+            logger.info(
+                "Batch-classifying %d articles (max_concurrency=%d).",
+                len(pending),
+                max_concurrency,
+            )
+            firsts = await llm_with_tools.abatch(
+                [entry[2] for entry in pending],
+                config={"max_concurrency": max_concurrency},
+            )
 
-        logger.info(
-            "Classifier LLM raw output='%s' mapped to area='%s' (candidates=%s)",
-            raw_area,
-            area,
-            candidates,
-        )
+            finished = await asyncio.gather(
+                *[
+                    self._afinish(
+                        first, messages, candidates, query_for_mcp,
+                        states[i], cache_key,
+                    )
+                    for first, (i, cache_key, messages, candidates, query_for_mcp)
+                    in zip(firsts, pending)
+                ]
+            )
+            for (i, *_), result in zip(pending, finished):
+                results[i] = result
 
-        new_state = dict(state)
-        new_state["area"] = area
-        return new_state
+        return results
+
+    @staticmethod
+    async def _execute_search_call_async(
+        call: Dict[str, Any],
+        default_query: str,
+        prefetch: "asyncio.Task | None" = None,
+    ) -> tuple[ToolMessage, bool]:
+        """Async twin of `_execute_search_call` using the async MCP client."""
+        args = call.get("args") or {}
+        call_id = call.get("id") or "search_articles_call"
+
+        query = args.get("query", default_query)
+        top_k = int(args.get("top_k", 5))
+
+        logger.info("Executing tool call: search_articles(top_k=%d)", top_k)
+
+        results = None
+        if prefetch is not None and query == default_query and top_k == 5:
+            try:
+                results = await prefetch
+                logger.debug("Using prefetched search_articles result.")
+            except Exception:
+                logger.exception("Prefetched search failed; retrying directly.")
+        elif prefetch is not None:
+            prefetch.cancel()
+
+        if results is None:
+            results = await _mcp_client_singleton.search_articles_async(
+                query=query, top_k=top_k
+            )
+
+        tool_msg = ToolMessage(
+            content=_dumps(results),
+            tool_call_id=call_id,
+        )
+        return tool_msg, bool(results)
 
 
 _classifier_agent = ClassifierAgent()
 
 
 def classifier_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    return _classifier_agent.run(state)
+    # LangGraph shallow-merges partial updates, so the node only returns
+    # the key it produces instead of echoing the whole state back.
+    return {"area": _classifier_agent.run(state)["area"]}
+
+
+async def aclassifier_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    return {"area": (await _classifier_agent.arun(state))["area"]}
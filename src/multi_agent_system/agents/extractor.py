@@ -5,15 +5,75 @@ from dataclasses import dataclass
 from typing import Dict, Any, List
 import json
 import logging
+import re
 
-import tiktoken
 from langchain_groq import ChatGroq
 from langchain_core.messages import SystemMessage, HumanMessage
 
-from ..config_loader import MultiAgentConfig
+from .._llm import get_chat_groq
+from .._result_cache import ResultCache, article_cache_key, result_cache_enabled
+from .._tokenization import truncate_by_tokens
+from ..config_loader import get_config
+
+try:
+    # Optional fast JSON parser (~2x faster than the stdlib module)
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    _ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# First fenced JSON object in an LLM response, with or without a `json` tag.
+_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+
+
+class _JsonStreamScanner:
+    """
+    Incrementally detect the first balanced top-level JSON object in a
+    streamed response.
+
+    Each chunk is scanned exactly once (state carries over between feeds),
+    tracking brace depth while ignoring braces inside quoted strings. Once
+    the object closes, `start`/`end` hold its span in the accumulated text
+    so the caller can slice out clean JSON regardless of surrounding prose
+    or an unterminated code fence.
+    """
+
+    def __init__(self) -> None:
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self.start = -1
+        self.end = -1
+
+    def feed(self, piece: str) -> bool:
+        """Scan one chunk; returns True when the object is complete."""
+        for ch in piece:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"' and self._depth > 0:
+                self._in_string = True
+            elif ch == "{":
+                if self._depth == 0:
+                    self.start = self._pos
+                self._depth += 1
+            elif ch == "}" and self._depth > 0:
+                self._depth -= 1
+                if self._depth == 0:
+                    self.end = self._pos
+                    return True
+            self._pos += 1
+        return False
+
 
 @dataclass
 class ExtractorAgent:
@@ -21,7 +81,36 @@ class ExtractorAgent:
     token_encoding: str = "cl100k_base"
 
     def __post_init__(self) -> None:
-        self._cfg = MultiAgentConfig()
+        self._cfg = get_config()
+        self._llm = self._build_llm()
+        self._system_prompt = self._cfg.get_prompt("extractor")
+        self._result_cache = ResultCache()
+
+    def _cached_extraction(
+        self,
+        article_text: str,
+        area: str | None,
+    ) -> tuple[str | None, Dict[str, Any] | None]:
+        """
+        Look up a previously computed extraction for this (article, area).
+
+        Returns (cache_key, cached_extraction); both are None when caching
+        is disabled via MULTI_AGENT_DISABLE_RESULT_CACHE, and the extraction
+        is None on a miss. A hit skips the LLM round-trip entirely.
+        """
+        if not result_cache_enabled():
+            return None, None
+
+        cache_key = article_cache_key(
+            article_text, self.max_article_tokens, extra=area or ""
+        )
+        extraction = self._result_cache.get(cache_key)
+        if extraction is not None:
+            logger.info(
+                "Extractor result cache hit (key=%s); skipping LLM call.",
+                cache_key,
+            )
+        return cache_key, extraction
 
     def _build_llm(self) -> ChatGroq:
         llm_cfg = self._cfg.get_llm_config()
@@ -34,30 +123,21 @@ class ExtractorAgent:
             temperature,
         )
 
-        return ChatGroq(
-            model=model,
-            temperature=temperature,
-        )
-
-    def _truncate_by_tokens(self, text: str) -> str:
-        if not text:
-            return ""
-
-        if int(self.max_article_tokens) <= 0:
-            return ""
+        return get_chat_groq(model, temperature)
 
-        enc = tiktoken.get_encoding(self.token_encoding)
-        tokens: List[int] = enc.encode(text)
-
-        if len(tokens) <= int(self.max_article_tokens):
-            return text
-
-        truncated = enc.decode(tokens[: int(self.max_article_tokens)])
-        logger.debug(
-            "Article text truncated by tokens from %d to %d tokens for extractor.",
-            len(tokens),
-            int(self.max_article_tokens),
+    def _truncate_by_tokens(self, text: str, strict_tokens: bool = False) -> str:
+        truncated = truncate_by_tokens(
+            text,
+            max_tokens=self.max_article_tokens,
+            encoding_name=self.token_encoding,
+            strict_tokens=strict_tokens,
         )
+        if len(truncated) < len(text):
+            logger.debug(
+                "Article text truncated from %d to %d chars for extractor.",
+                len(text),
+                len(truncated),
+            )
         return truncated
 
     def _extract_json_from_response(self, raw_content: str) -> Dict[str, Any]:
@@ -66,32 +146,39 @@ class ExtractorAgent:
             len(raw_content),
         )
 
+        # Hot path first: most responses are already bare JSON, so try to
+        # parse the whole content before paying for any fence matching.
         text = raw_content.strip()
-
-        if "```" in text:
-            parts = text.split("```")
-            for part in parts:
-                part = part.strip()
-                if part.startswith("json"):
-                    candidate = part[len("json"):].strip()
-                    text = candidate
-                    break
-                if part.startswith("{"):
-                    text = part
-                    break
-
         try:
-            parsed = json.loads(text)
-            if not isinstance(parsed, dict):
-                raise ValueError("Parsed JSON is not an object.")
-            logger.debug("Successfully parsed JSON object from LLM response.")
-            return parsed
-        except Exception as e:
-            logger.exception("Failed to parse JSON from LLM response.")
+            parsed = self._loads(text)
+        except (ValueError, TypeError):
+            match = _FENCE_RE.search(raw_content)
+            if match is None:
+                logger.exception("Failed to parse JSON from LLM response.")
+                raise ValueError(
+                    f"Failed to parse JSON from LLM response.\nRaw: {raw_content}"
+                )
+            try:
+                parsed = self._loads(match.group(1))
+            except (ValueError, TypeError) as e:
+                logger.exception("Failed to parse fenced JSON from LLM response.")
+                raise ValueError(
+                    f"Failed to parse JSON from LLM response: {e}\nRaw: {raw_content}"
+                )
+
+        if not isinstance(parsed, dict):
+            logger.error("Parsed JSON from LLM response is not an object.")
             raise ValueError(
-                f"Failed to parse JSON from LLM response: {e}\nRaw: {raw_content}"
+                f"Parsed JSON is not an object.\nRaw: {raw_content}"
             )
 
+        logger.debug("Successfully parsed JSON object from LLM response.")
+        return parsed
+
+    @staticmethod
+    def _loads(text: str) -> Any:
+        return orjson.loads(text) if _ORJSON_AVAILABLE else json.loads(text)
+
     def _normalize_extraction(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         expected_problem_key = "what problem does the artcle propose to solve?"
         expected_steps_key = "step by step on how to solve it"
@@ -129,21 +216,9 @@ class ExtractorAgent:
 
         return extraction
 
-    def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        article_text: str = state["article_text"]
-        area: str | None = state.get("area")
-
-        logger.info(
-            "Extractor agent started. Area=%s, article_length=%d chars",
-            area,
-            len(article_text),
-        )
-
+    def _build_messages(self, article_text: str, area: str | None) -> List[Any]:
         truncated_article = self._truncate_by_tokens(article_text)
 
-        system_prompt = self._cfg.get_prompt("extractor")
-        llm = self._build_llm()
-
         user_instructions = [
             "You must read the following article text and fill the JSON schema exactly.",
             "Return ONLY the JSON object, nothing else.",
@@ -158,15 +233,17 @@ class ExtractorAgent:
             + "\n--- ARTICLE TEXT END ---\n"
         )
 
-        messages = [
-            SystemMessage(content=system_prompt),
+        return [
+            SystemMessage(content=self._system_prompt),
             HumanMessage(content=human_content),
         ]
 
-        logger.debug("Sending extraction request to LLM.")
-        response = llm.invoke(messages)
-        raw_content = response.content
-
+    def _finalize(
+        self,
+        raw_content: str,
+        state: Dict[str, Any],
+        cache_key: str | None = None,
+    ) -> Dict[str, Any]:
         logger.debug(
             "Received extraction response from LLM (length=%d chars).",
             len(raw_content),
@@ -175,15 +252,140 @@ class ExtractorAgent:
         parsed = self._extract_json_from_response(raw_content)
         extraction = self._normalize_extraction(parsed)
 
-        new_state = dict(state)
-        new_state["extraction"] = extraction
+        if cache_key is not None:
+            self._result_cache.put(cache_key, extraction)
 
         logger.info("Extractor agent finished. Extraction object populated.")
-        return new_state
+        return {**state, "extraction": extraction}
+
+    def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        article_text: str = state["article_text"]
+        area: str | None = state.get("area")
+
+        logger.info(
+            "Extractor agent started. Area=%s, article_length=%d chars",
+            area,
+            len(article_text),
+        )
+
+        cache_key, cached = self._cached_extraction(article_text, area)
+        if cached is not None:
+            return {**state, "extraction": cached}
+
+        messages = self._build_messages(article_text, area)
+
+        logger.debug("Sending extraction request to LLM (streaming).")
+        scanner = _JsonStreamScanner()
+        chunks: List[str] = []
+        for chunk in self._llm.stream(messages):
+            piece = chunk.content or ""
+            if not piece:
+                continue
+            chunks.append(piece)
+            if scanner.feed(piece):
+                logger.debug("Balanced JSON object received; stopping stream early.")
+                break
+
+        return self._finalize(
+            self._streamed_content(chunks, scanner), state, cache_key
+        )
+
+    async def arun(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Async variant of `run` built on `astream` for concurrent pipelines."""
+        article_text: str = state["article_text"]
+        area: str | None = state.get("area")
+
+        logger.info(
+            "Extractor agent started (async). Area=%s, article_length=%d chars",
+            area,
+            len(article_text),
+        )
+
+        cache_key, cached = self._cached_extraction(article_text, area)
+        if cached is not None:
+            return {**state, "extraction": cached}
+
+        messages = self._build_messages(article_text, area)
+
+        logger.debug("Sending extraction request to LLM (streaming).")
+        scanner = _JsonStreamScanner()
+        chunks: List[str] = []
+        async for chunk in self._llm.astream(messages):
+            piece = chunk.content or ""
+            if not piece:
+                continue
+            chunks.append(piece)
+            if scanner.feed(piece):
+                logger.debug("Balanced JSON object received; stopping stream early.")
+                break
+
+        return self._finalize(
+            self._streamed_content(chunks, scanner), state, cache_key
+        )
+
+    async def run_many(self, states: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Extract from several articles with one batched LLM call.
+
+        `abatch` lets the provider handle the prompts concurrently instead
+        of N sequential round-trips. Result-cache hits skip the batch.
+        """
+        results: List[Dict[str, Any] | None] = [None] * len(states)
+        pending: List[tuple[int, str | None, List[Any]]] = []
+
+        for i, state in enumerate(states):
+            article_text = state["article_text"]
+            area = state.get("area")
+
+            cache_key, cached = self._cached_extraction(article_text, area)
+            if cached is not None:
+                results[i] = {**state, "extraction": cached}
+                continue
+            pending.append((i, cache_key, self._build_messages(article_text, area)))
+
+        if pending:
+            max_concurrency = int(
+                self._cfg.get_llm_config().get("max_concurrency", 8)
+            )
+
+            logger.info(
+                "Batch-extracting %d articles (max_concurrency=%d).",
+                len(pending),
+                max_concurrency,
+            )
+            responses = await self._llm.abatch(
+                [messages for _, _, messages in pending],
+                config={"max_concurrency": max_concurrency},
+            )
+
+            for (i, cache_key, _), response in zip(pending, responses):
+                results[i] = self._finalize(response.content, states[i], cache_key)
+
+        return results
+
+    @staticmethod
+    def _streamed_content(chunks: List[str], scanner: _JsonStreamScanner) -> str:
+        """
+        Assemble the streamed response for parsing.
+
+        When the scanner closed an object, slice its exact span so the JSON
+        parses cleanly even if the stream was cut before a closing fence;
+        otherwise hand the full buffer to the normal parse/fallback path.
+        """
+        content = "".join(chunks)
+        if scanner.end >= 0:
+            return content[scanner.start : scanner.end + 1]
+        return content
 
 
 _extractor_agent = ExtractorAgent()
 
 
 def extractor_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    return _extractor_agent.run(state)
+    # LangGraph shallow-merges partial updates, so the node only returns
+    # the key it produces instead of echoing the whole state back.
+    return {"extraction": _extractor_agent.run(state)["extraction"]}
+
+
+async def aextractor_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    return {"extraction": (await _extractor_agent.arun(state))["extraction"]}
@@ -1,15 +1,25 @@
 # src/multi_agent_system/reviewer_agent.py
 from __future__ import annotations
 
-from typing import Dict, Any, List
+from typing import Any, Callable, Dict, List
 import json
 import logging
 
-import tiktoken
 from langchain_groq import ChatGroq
 from langchain_core.messages import SystemMessage, HumanMessage
 
-from ..config_loader import MultiAgentConfig
+from .._llm import get_chat_groq
+from .._tokenization import truncate_by_tokens
+from ..config_loader import MultiAgentConfig, get_config
+
+try:
+    # Optional fast JSON serializer for the extraction block in the prompt
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    _ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +33,11 @@ class ReviewerAgent:
     ) -> None:
         self._max_article_tokens = int(max_article_tokens)
         self._token_encoding = token_encoding
-        self._cfg = config or MultiAgentConfig()
+        self._cfg = config or get_config()
         self._llm = self._build_llm()
+        # The system prompt never changes, so the message object itself is
+        # built once and shared across runs instead of per invocation.
+        self._system_message = SystemMessage(content=self._cfg.get_prompt("reviewer"))
 
         logger.info(
             "ReviewerAgent initialized with max_article_tokens=%d, token_encoding=%s",
@@ -43,30 +56,21 @@ class ReviewerAgent:
             temperature,
         )
 
-        return ChatGroq(
-            model=model,
-            temperature=temperature,
-        )
-
-    def _truncate_by_tokens(self, text: str) -> str:
-        if not text:
-            return ""
-
-        if self._max_article_tokens <= 0:
-            return ""
+        return get_chat_groq(model, temperature)
 
-        enc = tiktoken.get_encoding(self._token_encoding)
-        tokens: List[int] = enc.encode(text)
-
-        if len(tokens) <= self._max_article_tokens:
-            return text
-
-        truncated = enc.decode(tokens[: self._max_article_tokens])
-        logger.debug(
-            "Article text truncated by tokens from %d to %d tokens for reviewer.",
-            len(tokens),
-            self._max_article_tokens,
+    def _truncate_by_tokens(self, text: str, strict_tokens: bool = False) -> str:
+        truncated = truncate_by_tokens(
+            text,
+            max_tokens=self._max_article_tokens,
+            encoding_name=self._token_encoding,
+            strict_tokens=strict_tokens,
         )
+        if len(truncated) < len(text):
+            logger.debug(
+                "Article text truncated from %d to %d chars for reviewer.",
+                len(text),
+                len(truncated),
+            )
         return truncated
 
     def _build_human_message(
@@ -75,7 +79,12 @@ class ReviewerAgent:
         extraction: Dict[str, Any],
         article_text: str,
     ) -> str:
-        extraction_json = json.dumps(extraction, ensure_ascii=False, indent=2)
+        if _ORJSON_AVAILABLE:
+            extraction_json = orjson.dumps(
+                extraction, option=orjson.OPT_INDENT_2
+            ).decode("utf-8")
+        else:
+            extraction_json = json.dumps(extraction, ensure_ascii=False, indent=2)
         truncated_article = self._truncate_by_tokens(article_text)
 
         return (
@@ -90,7 +99,18 @@ class ReviewerAgent:
             "--- ARTICLE TEXT END ---\n"
         )
 
-    def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    def run(
+        self,
+        state: Dict[str, Any],
+        on_chunk: Callable[[str], Any] | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Generate the review, streaming it from the LLM.
+
+        `on_chunk`, when provided, receives each content chunk as it
+        arrives so callers can overlap consumption (e.g. writing the
+        review file, showing progress) with the tail of generation.
+        """
         area: str | None = state.get("area")
         extraction: Dict[str, Any] = state.get("extraction", {}) or {}
         article_text: str = state.get("article_text", "")
@@ -102,30 +122,82 @@ class ReviewerAgent:
             len(article_text),
         )
 
-        system_prompt = self._cfg.get_prompt("reviewer")
         human_content = self._build_human_message(area, extraction, article_text)
 
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message,
             HumanMessage(content=human_content),
         ]
 
-        logger.debug("Sending review generation request to LLM.")
-        response = self._llm.invoke(messages)
-        review_md = response.content.strip()
+        logger.debug("Sending review generation request to LLM (streaming).")
+        parts: List[str] = []
+        for chunk in self._llm.stream(messages):
+            piece = chunk.content or ""
+            if not piece:
+                continue
+            parts.append(piece)
+            if on_chunk is not None:
+                on_chunk(piece)
+        review_md = "".join(parts).strip()
 
         logger.info(
             "ReviewerAgent.run finished. Review length=%d chars.",
             len(review_md),
         )
 
-        new_state = dict(state)
-        new_state["review"] = review_md
-        return new_state
+        return {**state, "review": review_md}
+
+    async def arun(
+        self,
+        state: Dict[str, Any],
+        on_chunk: Callable[[str], Any] | None = None,
+    ) -> Dict[str, Any]:
+        """Async variant of `run` built on `astream` for concurrent pipelines."""
+        area: str | None = state.get("area")
+        extraction: Dict[str, Any] = state.get("extraction", {}) or {}
+        article_text: str = state.get("article_text", "")
+
+        logger.info(
+            "ReviewerAgent.arun started. Area=%s, extraction_keys=%s, article_length=%d",
+            area,
+            list(extraction.keys()),
+            len(article_text),
+        )
+
+        human_content = self._build_human_message(area, extraction, article_text)
+
+        messages = [
+            self._system_message,
+            HumanMessage(content=human_content),
+        ]
+
+        logger.debug("Sending review generation request to LLM (streaming).")
+        parts: List[str] = []
+        async for chunk in self._llm.astream(messages):
+            piece = chunk.content or ""
+            if not piece:
+                continue
+            parts.append(piece)
+            if on_chunk is not None:
+                on_chunk(piece)
+        review_md = "".join(parts).strip()
+
+        logger.info(
+            "ReviewerAgent.arun finished. Review length=%d chars.",
+            len(review_md),
+        )
+
+        return {**state, "review": review_md}
 
 
 _reviewer_agent = ReviewerAgent()
 
 
 def reviewer_node(state: Dict[str, Any]) -> Dict[str, Any]:
-    return _reviewer_agent.run(state)
+    # LangGraph shallow-merges partial updates, so the node only returns
+    # the key it produces instead of echoing the whole state back.
+    return {"review": _reviewer_agent.run(state)["review"]}
+
+
+async def areviewer_node(state: Dict[str, Any]) -> Dict[str, Any]:
+    return {"review": (await _reviewer_agent.arun(state))["review"]}
@@ -1,14 +1,32 @@
 # src/multi_agent_system/config_loader.py
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 import logging
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml not available; pure-Python parser
+    from yaml import SafeLoader as _YamlLoader
+
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_config(config_path: Path | None = None) -> "MultiAgentConfig":
+    """
+    Return a process-wide shared MultiAgentConfig for the given path.
+
+    Every agent used to instantiate its own MultiAgentConfig, re-reading
+    and re-parsing base.yaml each time; memoizing the constructor makes
+    that a single parse per process.
+    """
+    return MultiAgentConfig(config_path=config_path)
+
+
 class MultiAgentConfig:
 
     def __init__(self, config_path: Path | None = None) -> None:
@@ -28,7 +46,7 @@ class MultiAgentConfig:
 
         # Load the full config once
         with self.config_path.open("r", encoding="utf-8") as f:
-            self._config: Dict[str, Any] = yaml.safe_load(f) or {}
+            self._config: Dict[str, Any] = yaml.load(f, Loader=_YamlLoader) or {}
 
         logger.debug(
             "Full configuration loaded. Top-level keys: %s",
@@ -45,6 +63,20 @@ class MultiAgentConfig:
             list(self._multi_agent.keys()),
         )
 
+        # Resolve prompts and the LLM block once; get_prompt/get_llm_config
+        # sit on the per-run hot path and should be plain dict lookups.
+        self._prompts: Dict[str, str] = {
+            name: (cfg or {}).get("system") or ""
+            for name, cfg in (self._multi_agent.get("prompts") or {}).items()
+        }
+        self._llm_config: Dict[str, Any] = self._multi_agent.get("llm", {}) or {}
+
+        logger.debug(
+            "Prompts resolved for agents: %s | LLM config: %s",
+            list(self._prompts.keys()),
+            self._llm_config,
+        )
+
     # Public API
     def get_multi_agent_config(self) -> Dict[str, Any]:
         """
@@ -58,11 +90,7 @@ class MultiAgentConfig:
         agent_name: 'classifier' | 'extractor' | 'reviewer'
         Returns the system prompt string for the given agent.
         """
-        logger.info("Fetching system prompt for agent: %s", agent_name)
-
-        prompts = self._multi_agent.get("prompts", {}) or {}
-        agent_cfg = prompts.get(agent_name, {}) or {}
-        system_prompt = agent_cfg.get("system")
+        system_prompt = self._prompts.get(agent_name)
 
         if not system_prompt:
             logger.error(
@@ -75,15 +103,8 @@ class MultiAgentConfig:
                 f"in {self.config_path}."
             )
 
-        logger.debug(
-            "System prompt for agent '%s' loaded (length=%d).",
-            agent_name,
-            len(system_prompt),
-        )
         return system_prompt
 
 
     def get_llm_config(self) -> Dict[str, Any]:
-        llm_cfg = self._multi_agent.get("llm", {}) or {}
-        logger.info("Loaded LLM config: %s", llm_cfg)
-        return llm_cfg
+        return self._llm_config
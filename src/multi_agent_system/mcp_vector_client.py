@@ -1,61 +1,236 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import hashlib
 import logging
+import os
+import threading
 from dataclasses import dataclass, field
-from pathlib import Path
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from langchain_core.tools import tool
 
-import yaml
 from fastmcp import Client
 from pydantic import ValidationError
 
+from src.mcp_server._config import ROOT_DIR, load_config
+
+try:
+    # Optional persistent cache for search results; identical queries are
+    # common across dev/test reruns and each one pays a vector search.
+    import diskcache
+
+    _DISKCACHE_AVAILABLE = True
+except ImportError:
+    diskcache = None
+    _DISKCACHE_AVAILABLE = False
 from src.mcp_server.schemas import (
-    SearchArticlesRequest,
     SearchArticlesResponse,
-    GetArticleContentRequest,
+    SearchArticlesBatchResponse,
     ArticleContent,
 )
 
 logger = logging.getLogger(__name__)
 
-ROOT_DIR = Path(__file__).resolve().parents[2]
-CONFIG_PATH = ROOT_DIR / "configuration" / "base.yaml"
+def _default_mcp_url() -> str:
+    """
+    Resolve the MCP server URL from configuration.
 
-if not CONFIG_PATH.exists():
-    raise FileNotFoundError(f"Configuration file not found: {CONFIG_PATH}")
+    Evaluated lazily (as a dataclass default factory) so importing this
+    module does not touch the config file; `load_config` caches the parse.
+    """
+    mcp_cfg: Dict[str, Any] = load_config().get("mcp", {}) or {}
+    host: str = mcp_cfg.get("host", "127.0.0.1")
+    port: int = int(mcp_cfg.get("port", 8000))
+    path: str = mcp_cfg.get("path", "/mcp")
 
-with CONFIG_PATH.open("r", encoding="utf-8") as f:
-    _config: Dict[str, Any] = yaml.safe_load(f) or {}
+    return mcp_cfg.get("url", f"http://{host}:{port}{path}")
 
-_mcp_cfg: Dict[str, Any] = _config.get("mcp", {}) or {}
-_MCP_HOST: str = _mcp_cfg.get("host", "127.0.0.1")
-_MCP_PORT: int = int(_mcp_cfg.get("port", 8000))
-_MCP_PATH: str = _mcp_cfg.get("path", "/mcp")
 
-_DEFAULT_MCP_URL: str = _mcp_cfg.get(
-    "url",
-    f"http://{_MCP_HOST}:{_MCP_PORT}{_MCP_PATH}",
-)
+# Cached search results expire after an hour: long enough to cover a dev
+# loop, short enough that a rebuilt index is picked up the same day.
+_SEARCH_CACHE_TTL = 3600
+
+
+@lru_cache(maxsize=1)
+def _search_cache() -> "diskcache.Cache | None":
+    """
+    On-disk cache for search_articles responses, or None when disabled.
+
+    Disabled when diskcache is not installed or MCP_DISABLE_CACHE is set
+    to a truthy value (e.g. in tests exercising the live server).
+    """
+    if not _DISKCACHE_AVAILABLE:
+        return None
+    if os.environ.get("MCP_DISABLE_CACHE", "").strip().lower() in {
+        "1", "true", "yes", "on",
+    }:
+        return None
+    return diskcache.Cache(str(ROOT_DIR / ".cache" / "mcp"))
+
+
+def _search_cache_key(query: str, top_k: int) -> str:
+    return hashlib.blake2b(
+        f"{top_k}|{query}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+# Shared connected clients keyed by (event loop id, url). Without the pool,
+# every tool call outside an async context opened a fresh HTTP+MCP session —
+# handshake plus initialize — just to issue one RPC. Keyed per loop because
+# a connection is only usable from the loop it was opened on. The loop
+# object is stored alongside the client: asyncio.run loops are short-lived
+# and CPython reuses object ids, so an id alone could alias a dead entry.
+_CLIENT_POOL: Dict[tuple[int, str], tuple[asyncio.AbstractEventLoop, Client]] = {}
+_POOL_LOCKS: Dict[int, tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
+
+
+def _evict_dead_pool_entries() -> None:
+    # Clients bound to closed loops cannot be awaited for shutdown; drop
+    # the references so their transports get collected and a new loop
+    # reusing the same id never picks up a dead client.
+    for key, (loop, _client) in list(_CLIENT_POOL.items()):
+        if loop.is_closed():
+            _CLIENT_POOL.pop(key, None)
+            _POOL_LOCKS.pop(key[0], None)
+
+
+async def _pooled_client(url: str) -> Client:
+    """Return a connected shared client for `url` on the running loop."""
+    loop = asyncio.get_running_loop()
+    key = (id(loop), url)
+
+    _evict_dead_pool_entries()
+
+    entry = _CLIENT_POOL.get(key)
+    if entry is not None and entry[0] is loop:
+        return entry[1]
+
+    lock_entry = _POOL_LOCKS.get(id(loop))
+    if lock_entry is None or lock_entry[0] is not loop:
+        lock_entry = (loop, asyncio.Lock())
+        _POOL_LOCKS[id(loop)] = lock_entry
+
+    async with lock_entry[1]:
+        entry = _CLIENT_POOL.get(key)
+        if entry is None or entry[0] is not loop:
+            logger.debug("Opening pooled MCP client for %s", url)
+            client = Client(url)
+            await client.__aenter__()
+            _CLIENT_POOL[key] = (loop, client)
+        else:
+            client = entry[1]
+    return client
+
+
+async def _aclose_pool() -> None:
+    for loop, client in list(_CLIENT_POOL.values()):
+        if loop.is_closed():
+            continue
+        try:
+            await client.__aexit__(None, None, None)
+        except Exception:
+            logger.debug("Error closing pooled MCP client.", exc_info=True)
+    _CLIENT_POOL.clear()
+    _POOL_LOCKS.clear()
+
+
+def _shutdown_client_pool() -> None:
+    """Best-effort close of pooled clients at interpreter exit."""
+    if not _CLIENT_POOL:
+        return
+
+    if _LOOP_THREAD is not None:
+        try:
+            _LOOP_THREAD.submit(_aclose_pool())
+            return
+        except Exception:
+            logger.debug(
+                "Pool shutdown via background loop failed.", exc_info=True
+            )
+
+    try:
+        asyncio.run(_aclose_pool())
+    except Exception:
+        # Clients bound to already-closed loops cannot be shut down here;
+        # their transports die with the process anyway.
+        logger.debug("MCP client pool shutdown skipped.", exc_info=True)
+
+
+atexit.register(_shutdown_client_pool)
+
+
+class _AsyncLoopThread:
+    """
+    Daemon thread hosting a persistent event loop for sync callers.
+
+    asyncio.run per sync call built and tore down a loop every time, which
+    also killed any pooled connection bound to it. One long-lived loop
+    keeps the pooled MCP clients alive across sync calls and lets several
+    threads issue concurrent calls into the same loop.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="mcp-client-loop",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def submit(self, coro):
+        """Run `coro` on the background loop and block for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+_LOOP_THREAD: Optional[_AsyncLoopThread] = None
+_LOOP_THREAD_LOCK = threading.Lock()
+
+
+def _get_loop_thread() -> _AsyncLoopThread:
+    global _LOOP_THREAD
+    if _LOOP_THREAD is None:
+        with _LOOP_THREAD_LOCK:
+            if _LOOP_THREAD is None:
+                _LOOP_THREAD = _AsyncLoopThread()
+    return _LOOP_THREAD
 
 
 def _run_sync(coro):
     try:
         asyncio.get_running_loop()
     except RuntimeError:
-        return asyncio.run(coro)
+        return _get_loop_thread().submit(coro)
     raise RuntimeError(
         "An asyncio event loop is already running. "
         "Use the async methods or an async context manager."
     )
 
 
+_PLAIN_TYPES = (str, int, float, bool, type(None))
+
+
 def _to_plain(obj: Any) -> Any:
-    if obj is None:
-        return None
+    # Primitives and already-plain containers come back untouched; the
+    # recursive walk only runs when something actually needs converting.
+    if isinstance(obj, _PLAIN_TYPES):
+        return obj
+    if isinstance(obj, dict):
+        if all(isinstance(v, _PLAIN_TYPES) for v in obj.values()):
+            return obj
+        return {k: _to_plain(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        if all(isinstance(v, _PLAIN_TYPES) for v in obj):
+            return obj
+        return [_to_plain(v) for v in obj]
+    if isinstance(obj, tuple):
+        return [_to_plain(v) for v in obj]
     if hasattr(obj, "model_dump"):
         try:
+            # pydantic-core traverses the whole model tree in one call,
+            # replacing a per-attribute Python-level recursion.
             return obj.model_dump()
         except Exception:
             pass
@@ -64,10 +239,6 @@ def _to_plain(obj: Any) -> Any:
             return obj.dict()
         except Exception:
             pass
-    if isinstance(obj, dict):
-        return {k: _to_plain(v) for k, v in obj.items()}
-    if isinstance(obj, (list, tuple)):
-        return [_to_plain(v) for v in obj]
     if hasattr(obj, "__dict__"):
         try:
             return {k: _to_plain(v) for k, v in vars(obj).items()}
@@ -76,6 +247,19 @@ def _to_plain(obj: Any) -> Any:
     return obj
 
 
+def _strict_validation_enabled() -> bool:
+    """
+    Whether responses must go through full Pydantic validation.
+
+    The MCP server validates payloads before sending them, so the client
+    trusts well-shaped dicts by default; set MCP_STRICT_VALIDATE=1 to
+    force revalidation when debugging schema mismatches.
+    """
+    return os.environ.get("MCP_STRICT_VALIDATE", "").strip().lower() in {
+        "1", "true", "yes", "on",
+    }
+
+
 def _validate_model(model_cls, raw: Any):
     try:
         return model_cls.model_validate(raw)
@@ -85,31 +269,69 @@ def _validate_model(model_cls, raw: Any):
 
 @dataclass
 class MCPVectorStoreClient:
-    url: str = _DEFAULT_MCP_URL
+    url: str = field(default_factory=_default_mcp_url)
     _client: Optional[Client] = field(default=None, init=False, repr=False)
+    _client_loop: Optional[asyncio.AbstractEventLoop] = field(
+        default=None, init=False, repr=False
+    )
 
     def _make_client(self) -> Client:
         return Client(self.url)
 
-    async def __aenter__(self) -> "MCPVectorStoreClient":
+    async def _ensure_client(self) -> Client:
+        """
+        Return a connected client, reusing one per event loop.
+
+        Opening a fastmcp Client pays TCP connection setup and the MCP
+        session handshake; keeping it open lets consecutive tool calls on
+        the same loop share a keep-alive connection. A client left over
+        from a closed loop is discarded and replaced.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._client is not None and self._client_loop is not loop:
+            logger.debug("Dropping MCP client bound to a previous event loop.")
+            self._client = None
+            self._client_loop = None
+
         if self._client is None:
             self._client = self._make_client()
             await self._client.__aenter__()
+            self._client_loop = loop
+
+        return self._client
+
+    async def __aenter__(self) -> "MCPVectorStoreClient":
+        await self._ensure_client()
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
         if self._client is not None:
             await self._client.__aexit__(exc_type, exc, tb)
             self._client = None
+            self._client_loop = None
+
+    async def aclose(self) -> None:
+        """Explicitly close the underlying client connection, if open."""
+        await self.__aexit__(None, None, None)
 
     async def _call_tool(self, tool_name: str, args: Dict[str, Any]) -> Any:
-        if self._client is None:
-            async with self._make_client() as client:
-                result = await client.call_tool(tool_name, args)
-                data = getattr(result, "data", result)
-                return _to_plain(data)
+        # A client opened via the async context manager keeps its scoped
+        # lifetime; everything else shares the module-level pool.
+        client = self._client
+        if client is None or self._client_loop is not asyncio.get_running_loop():
+            client = await _pooled_client(self.url)
+
+        result = await client.call_tool(tool_name, args)
+
+        # fastmcp exposes the raw JSON payload as `structured_content`
+        # alongside `data` (the same payload hydrated into typed objects).
+        # The fast paths downstream consume plain dicts, so taking the raw
+        # payload skips both the hydration and the _to_plain walk.
+        structured = getattr(result, "structured_content", None)
+        if isinstance(structured, dict):
+            return structured
 
-        result = await self._client.call_tool(tool_name, args)
         data = getattr(result, "data", result)
         return _to_plain(data)
 
@@ -131,9 +353,35 @@ class MCPVectorStoreClient:
     async def search_articles_async(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         logger.info("Calling MCP search_articles | top_k=%d | query_length=%d", top_k, len(query))
 
-        req = SearchArticlesRequest(query=query, top_k=top_k)
-        raw_data = await self._call_tool("search_articles", req.model_dump())
-
+        cache = _search_cache()
+        cache_key = None
+        if cache is not None:
+            cache_key = _search_cache_key(query, top_k)
+            hit = cache.get(cache_key)
+            if hit is not None:
+                logger.info("search_articles disk cache hit; skipping MCP call.")
+                return hit
+
+        # The server already validates the request, so a plain dict payload
+        # avoids a client-side Pydantic construct+dump per call.
+        raw_data = await self._call_tool(
+            "search_articles", {"query": query, "top_k": int(top_k)}
+        )
+
+        # Fast path: _call_tool returns plain dicts, and the hits are
+        # consumed as dicts anyway, so validating into models only to dump
+        # them straight back was two redundant Pydantic passes per call.
+        if not _strict_validation_enabled() and isinstance(raw_data, dict):
+            results = raw_data.get("results")
+            if isinstance(results, list) and all(
+                isinstance(item, dict) for item in results
+            ):
+                if cache_key is not None:
+                    cache.set(cache_key, results, expire=_SEARCH_CACHE_TTL)
+                return results
+
+        # Anything shaped unexpectedly still goes through full validation
+        # so schema errors surface with the usual diagnostics.
         try:
             resp = _validate_model(SearchArticlesResponse, raw_data)
         except ValidationError as e:
@@ -142,7 +390,79 @@ class MCPVectorStoreClient:
                 f"Invalid response schema from MCP server: {e} | raw_type={type(raw_data).__name__}"
             ) from e
 
-        return [article.model_dump() for article in resp.results]
+        results = [article.model_dump() for article in resp.results]
+        if cache_key is not None:
+            cache.set(cache_key, results, expire=_SEARCH_CACHE_TTL)
+        return results
+
+    def search_articles_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Batched variant of `search_articles`: one embedding/query round-trip
+        for several queries. Returns one result list per input query.
+        """
+        return _run_sync(
+            self.search_articles_batch_async(queries=queries, top_k=top_k)
+        )
+
+    async def search_articles_batch_async(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+    ) -> List[List[Dict[str, Any]]]:
+        logger.info(
+            "Calling MCP search_articles_batch | top_k=%d | n_queries=%d",
+            top_k,
+            len(queries),
+        )
+
+        try:
+            raw_data = await self._call_tool(
+                "search_articles_batch",
+                {"queries": list(queries), "top_k": int(top_k)},
+            )
+        except Exception:
+            # Older servers may not expose the batch tool yet; degrade to
+            # concurrent single-query searches instead of failing the batch.
+            logger.warning(
+                "search_articles_batch tool unavailable; falling back to "
+                "%d concurrent single-query searches.",
+                len(queries),
+            )
+            return list(
+                await asyncio.gather(
+                    *[
+                        self.search_articles_async(query=query, top_k=top_k)
+                        for query in queries
+                    ]
+                )
+            )
+
+        # Same trusted fast path as the single-query search: one result
+        # list per query, each a list of plain hit dicts.
+        if not _strict_validation_enabled() and isinstance(raw_data, dict):
+            batches = raw_data.get("results")
+            if isinstance(batches, list) and all(
+                isinstance(batch, dict) and isinstance(batch.get("results"), list)
+                for batch in batches
+            ):
+                return [batch["results"] for batch in batches]
+
+        try:
+            resp = _validate_model(SearchArticlesBatchResponse, raw_data)
+        except ValidationError as e:
+            logger.exception("Invalid SearchArticlesBatchResponse from MCP.")
+            raise RuntimeError(
+                f"Invalid response schema from MCP server: {e} | raw_type={type(raw_data).__name__}"
+            ) from e
+
+        return [
+            [article.model_dump() for article in batch.results]
+            for batch in resp.results
+        ]
 
     @tool("get_article_content")
     def get_article_content(self, article_id: str) -> Dict[str, Any]:
@@ -160,8 +480,13 @@ class MCPVectorStoreClient:
     async def get_article_content_async(self, article_id: str) -> Dict[str, Any]:
         logger.info("Calling MCP get_article_content | article_id=%s", article_id)
 
-        req = GetArticleContentRequest(article_id=article_id)
-        raw_data = await self._call_tool("get_article_content", req.model_dump())
+        raw_data = await self._call_tool(
+            "get_article_content", {"article_id": article_id}
+        )
+
+        # Trusted fast path: the server already validated this payload.
+        if not _strict_validation_enabled() and isinstance(raw_data, dict) and raw_data:
+            return raw_data
 
         try:
             article = _validate_model(ArticleContent, raw_data)
@@ -172,3 +497,31 @@ class MCPVectorStoreClient:
             ) from e
 
         return article.model_dump()
+
+    def get_article_contents(self, article_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch several article contents concurrently; one result per id.
+        """
+        return _run_sync(self.get_article_contents_async(article_ids))
+
+    async def get_article_contents_async(
+        self,
+        article_ids: List[str],
+    ) -> List[Dict[str, Any]]:
+        """
+        Coalesce N get_article_content round-trips into one gather, so the
+        batch completes in ~one RTT over the pooled connection instead of
+        N sequential trips.
+        """
+        logger.info(
+            "Calling MCP get_article_content for %d articles concurrently.",
+            len(article_ids),
+        )
+        return list(
+            await asyncio.gather(
+                *[
+                    self.get_article_content_async(article_id=article_id)
+                    for article_id in article_ids
+                ]
+            )
+        )
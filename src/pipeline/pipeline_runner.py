@@ -1,19 +1,55 @@
 # src/multi_agent_system/pipeline_runner.py
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
 import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from shutil import copy2
 from typing import Dict, Any
-from urllib.request import urlretrieve
+
+import httpx
+
+try:
+    # Optional fast JSON serializer for the persisted pipeline output
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    _ORJSON_AVAILABLE = False
+
+try:
+    # Optional fast hash for the extracted-text cache key. The key only
+    # needs collision resistance within the samples set, so blake3's
+    # SIMD throughput beats sha1 with no downside.
+    from blake3 import blake3 as _cache_hasher
+
+    _BLAKE3_AVAILABLE = True
+except ImportError:
+    _cache_hasher = hashlib.sha1
+    _BLAKE3_AVAILABLE = False
 
 from src.pdf_parser.pdf_parser import PdfTextExtractor
+from src.multi_agent_system.config_loader import get_config
 from src.multi_agent_system.multi_agent_graph import run_pipeline
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP client: keep-alive connections mean repeat downloads from the
+# same host (arxiv, journal sites) skip the TCP+TLS handshake. Constructing
+# the client is cheap — connections are only opened on first use.
+_HTTP = httpx.Client(
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+    timeout=60.0,
+    follow_redirects=True,
+)
+atexit.register(_HTTP.close)
+
 
 class ArticleSampleManager:
     """
@@ -31,8 +67,31 @@ class ArticleSampleManager:
     def __init__(self, samples_dir: Path | str = "samples") -> None:
         self.samples_dir = Path(samples_dir)
         self.samples_dir.mkdir(exist_ok=True)
+        self._index_file = self.samples_dir / ".next_index"
 
     def get_next_sample_index(self) -> int:
+        """
+        Return the next available sample index.
+
+        The counter lives in `samples/.next_index`, so allocation is O(1)
+        no matter how many samples have accumulated; the first call (or a
+        missing/corrupt counter) bootstraps it by scanning the existing
+        `output_N.json` files once. The increment is written via a temp
+        file and `os.replace` so a crash never leaves a half-written
+        counter.
+        """
+        try:
+            next_index = int(self._index_file.read_text(encoding="utf-8").strip())
+        except (OSError, ValueError):
+            next_index = self._scan_next_index()
+
+        tmp_path = self._index_file.with_name(".next_index.tmp")
+        tmp_path.write_text(str(next_index + 1), encoding="utf-8")
+        os.replace(tmp_path, self._index_file)
+
+        return next_index
+
+    def _scan_next_index(self) -> int:
         """
         Inspect existing `output_N.json` files and return the next available N.
         """
@@ -55,7 +114,13 @@ class ArticleSampleManager:
         logger.info("Downloading article from URL: %s -> %s", url, target_path)
 
         try:
-            urlretrieve(url, target_path)
+            # Stream to disk in chunks so large PDFs never buffer fully in
+            # memory, over the pooled keep-alive client.
+            with _HTTP.stream("GET", url) as response:
+                response.raise_for_status()
+                with target_path.open("wb") as f:
+                    for chunk in response.iter_bytes(65536):
+                        f.write(chunk)
         except Exception as e:
             logger.error("Failed to download URL %s: %s", url, e)
             raise
@@ -83,13 +148,57 @@ class ArticleSampleManager:
 
         logger.info("Copying local article to samples: %s -> %s", src, target_path)
         try:
-            copy2(src, target_path)
+            self._fast_copy(src, target_path)
         except Exception as e:
             logger.error("Failed to copy input file %s to %s: %s", src, target_path, e)
             raise
 
         return target_path
 
+    @staticmethod
+    def _fast_copy(src: Path, target_path: Path) -> None:
+        """
+        Copy `src` to `target_path`, cheapest mechanism first.
+
+        A hardlink is O(1) and needs no data movement but requires the same
+        filesystem; os.sendfile copies kernel-side without routing the bytes
+        through userspace. shutil.copy2 remains the portable fallback
+        (Windows, filesystems without either).
+        """
+        try:
+            if target_path.exists():
+                target_path.unlink()
+            os.link(src, target_path)
+            return
+        except OSError:
+            logger.debug(
+                "Hardlink from %s to %s failed; trying sendfile.",
+                src,
+                target_path,
+            )
+
+        try:
+            st = src.stat()
+            with src.open("rb") as fsrc, target_path.open("wb") as fdst:
+                offset = 0
+                remaining = st.st_size
+                while remaining > 0:
+                    sent = os.sendfile(
+                        fdst.fileno(), fsrc.fileno(), offset, remaining
+                    )
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+            os.utime(target_path, (st.st_atime, st.st_mtime))
+            return
+        except (OSError, AttributeError):
+            logger.debug(
+                "sendfile copy unavailable; falling back to shutil.copy2."
+            )
+
+        copy2(src, target_path)
+
     def resolve_input_source(self, raw_source: str) -> tuple[int, Path]:
         """
         Given a raw CLI argument (path or URL), resolve it to a normalized path
@@ -132,26 +241,113 @@ class ArticlePipelineRunner:
     `ArticleSampleManager`.
     """
 
-    def __init__(self, sample_manager: ArticleSampleManager) -> None:
+    def __init__(
+        self,
+        sample_manager: ArticleSampleManager,
+        use_text_cache: bool = True,
+        pipeline_parallel: bool = False,
+    ) -> None:
         self.sample_manager = sample_manager
+        self.use_text_cache = use_text_cache
+        self.pipeline_parallel = pipeline_parallel
 
     @staticmethod
-    def _load_article_text(input_path: Path) -> str:
+    def _extract_pdf_until_cap(input_path: Path, max_chars: int) -> str:
+        """
+        Extract PDF text page by page, stopping at the pipeline's char cap.
+
+        Everything past `max_article_chars` is discarded downstream anyway,
+        so once enough text has accumulated the remaining pages are never
+        parsed — for long documents this skips most of the extraction work
+        that the serial full-document path would do before truncating.
+        """
+        parts: list[str] = []
+        total = 0
+        for page_text in PdfTextExtractor.iter_pages(input_path):
+            if page_text:
+                parts.append(page_text)
+                total += len(page_text) + 2
+            if max_chars > 0 and total >= max_chars:
+                logger.info(
+                    "Collected %d chars after partial extraction; "
+                    "skipping the remaining pages.",
+                    total,
+                )
+                break
+        return "\n\n".join(parts).strip()
+
+    def _text_cache_path(self, input_path: Path) -> Path:
+        """
+        Cache location for extracted text, keyed by the PDF's content hash
+        so renames and re-downloads of the same document still hit.
+        """
+        hasher = _cache_hasher()
+        with input_path.open("rb") as fh:
+            # Stream in 1 MiB chunks so multi-MB PDFs are never held in
+            # memory just to be hashed.
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                hasher.update(chunk)
+        return (
+            self.sample_manager.samples_dir / ".cache" / f"{hasher.hexdigest()}.txt"
+        )
+
+    def _load_article_text(self, input_path: Path) -> str:
         """
         Read article text from a PDF or plain text file.
+
+        PDF extraction results are cached on disk under `samples/.cache/`
+        keyed by content hash — re-running a source turns PyPDF (or
+        seconds-to-minutes of OCR) into a single read_text. The text is
+        capped to `multi_agent.max_article_chars` here, once, so the
+        agents' token truncation works on a bounded string instead of each
+        carrying the full document through the pipeline state.
         """
         suffix = input_path.suffix.lower()
 
+        max_chars = int(
+            get_config().get_multi_agent_config().get("max_article_chars", 30000)
+        )
+
         if suffix == ".pdf":
-            return PdfTextExtractor.extract(input_path, enable_ocr=True)
+            cache_path = None
+            text = None
+            if self.use_text_cache:
+                cache_path = self._text_cache_path(input_path)
+                if cache_path.exists():
+                    logger.info("Using cached extracted text: %s", cache_path)
+                    text = cache_path.read_text(encoding="utf-8")
+
+            if text is None and self.pipeline_parallel:
+                # Early-stop path: extract only until the pipeline cap is
+                # covered. Empty output (e.g. a scanned PDF) falls through
+                # to the full extractor and its OCR fallback; partial text
+                # is deliberately not cached.
+                text = self._extract_pdf_until_cap(input_path, max_chars) or None
+
+            if text is None:
+                text = PdfTextExtractor.extract(input_path, enable_ocr=True)
+                if cache_path is not None:
+                    cache_path.parent.mkdir(exist_ok=True)
+                    cache_path.write_text(text, encoding="utf-8")
+                    logger.debug("Cached extracted text at: %s", cache_path)
         elif suffix in {".txt", ".md"}:
-            return input_path.read_text(encoding="utf-8")
+            text = input_path.read_text(encoding="utf-8")
         else:
             raise ValueError(
                 f"Unsupported file extension '{suffix}'. "
                 "Please provide a .pdf, .txt or .md file."
             )
 
+        if max_chars > 0 and len(text) > max_chars:
+            logger.info(
+                "Capping article text from %d to %d chars for the pipeline.",
+                len(text),
+                max_chars,
+            )
+            text = text[:max_chars]
+
+        return text
+
     def run_for_source(self, raw_source: str) -> Dict[str, Any]:
         """
         Main entry point for the pipeline, given either:
@@ -170,6 +366,42 @@ class ArticlePipelineRunner:
         # 1) Normalize input and assign index
         idx, normalized_path = self.sample_manager.resolve_input_source(raw_source)
 
+        return self._run_resolved(idx, normalized_path)
+
+    def run_for_sources(self, raw_sources: list[str]) -> list[Dict[str, Any]]:
+        """
+        Run the pipeline for several sources concurrently.
+
+        Index allocation and input normalization stay serial so the sample
+        counter is never raced; the extract+LLM+write phase — where nearly
+        all the wall time goes, most of it blocked on LLM round-trips —
+        then fans out across a thread pool. Results are returned in input
+        order.
+        """
+        resolved = [
+            self.sample_manager.resolve_input_source(raw_source)
+            for raw_source in raw_sources
+        ]
+
+        max_workers = int(
+            get_config().get_multi_agent_config().get("max_parallel_sources", 4)
+        )
+        max_workers = max(1, min(max_workers, len(resolved)))
+
+        logger.info(
+            "Running pipeline for %d sources with %d workers.",
+            len(resolved),
+            max_workers,
+        )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._run_resolved, idx, normalized_path)
+                for idx, normalized_path in resolved
+            ]
+            return [future.result() for future in futures]
+
+    def _run_resolved(self, idx: int, normalized_path: Path) -> Dict[str, Any]:
         # 2) Load text
         logger.info("Reading article from normalized path: %s", normalized_path)
         article_text = self._load_article_text(normalized_path)
@@ -194,8 +426,13 @@ class ArticlePipelineRunner:
         }
 
         output_json_path = self.sample_manager.get_output_json_path(idx)
-        with output_json_path.open("w", encoding="utf-8") as f:
-            json.dump(final_payload, f, ensure_ascii=False, indent=2)
+        if _ORJSON_AVAILABLE:
+            output_json_path.write_bytes(
+                orjson.dumps(final_payload, option=orjson.OPT_INDENT_2)
+            )
+        else:
+            with output_json_path.open("w", encoding="utf-8") as f:
+                json.dump(final_payload, f, ensure_ascii=False, indent=2)
 
         # 5) Log and return metadata
         logger.info("Area classification: %s", area)
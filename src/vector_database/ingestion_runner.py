@@ -2,16 +2,39 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not installed
+    from yaml import SafeLoader as _YamlLoader
+
 from src.vector_database.vector_database import VectorDatabase
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _load_yaml(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a YAML file, memoized on (path, mtime).
+
+    Repeated builder constructions share one parse; editing the file bumps
+    the mtime and naturally invalidates the cached entry.
+    """
+    with open(path_str, "r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
+
+
+# VectorDatabase instances keyed by their full parameter tuple: reusing one
+# keeps the loaded sentence-transformers model warm across build passes.
+_VECTOR_DB_CACHE: Dict[tuple, VectorDatabase] = {}
+
+
 class VectorIndexBuilder:
     """
     High-level orchestrator for building (or rebuilding) the Chroma vector index
@@ -51,8 +74,9 @@ class VectorIndexBuilder:
         Load and return the full YAML configuration.
         """
         logger.info("Loading configuration from: %s", self.config_path)
-        with self.config_path.open("r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+        config = _load_yaml(
+            str(self.config_path), self.config_path.stat().st_mtime_ns
+        )
         logger.debug("Configuration loaded successfully.")
         return config
 
@@ -93,13 +117,19 @@ class VectorIndexBuilder:
             "embedding_model",
             "sentence-transformers/all-MiniLM-L6-v2",
         )
+        embedding_backend = vdb_cfg.get("embedding_backend", "torch")
         collection_name = vdb_cfg.get("collection_name", "articles")
         chunk_size = int(vdb_cfg.get("chunk_size", 1000))
         chunk_overlap = int(vdb_cfg.get("chunk_overlap", 200))
+        encode_batch_size = int(vdb_cfg.get("encode_batch_size", 256))
+        hnsw_m = int(vdb_cfg.get("hnsw_m", 24))
+        hnsw_ef_construction = int(vdb_cfg.get("hnsw_ef_construction", 128))
+        hnsw_ef_search = int(vdb_cfg.get("hnsw_ef_search", 100))
 
         logger.info(
-            "Vector DB config -> model=%s | collection=%s | chunk_size=%d | chunk_overlap=%d",
+            "Vector DB config -> model=%s | backend=%s | collection=%s | chunk_size=%d | chunk_overlap=%d",
             embedding_model,
+            embedding_backend,
             collection_name,
             chunk_size,
             chunk_overlap,
@@ -107,9 +137,14 @@ class VectorIndexBuilder:
 
         return {
             "embedding_model": embedding_model,
+            "embedding_backend": embedding_backend,
             "collection_name": collection_name,
             "chunk_size": chunk_size,
             "chunk_overlap": chunk_overlap,
+            "encode_batch_size": encode_batch_size,
+            "hnsw_m": hnsw_m,
+            "hnsw_ef_construction": hnsw_ef_construction,
+            "hnsw_ef_search": hnsw_ef_search,
         }
 
     def create_vector_db(self) -> VectorDatabase:
@@ -121,20 +156,37 @@ class VectorIndexBuilder:
         pdf_root_path, chroma_path = self._resolve_paths()
         vdb_params = self._resolve_vector_db_params()
 
+        cache_key = (
+            str(pdf_root_path),
+            str(chroma_path),
+            *(vdb_params[name] for name in sorted(vdb_params)),
+        )
+        cached = _VECTOR_DB_CACHE.get(cache_key)
+        if cached is not None:
+            logger.debug("Reusing cached VectorDatabase instance.")
+            return cached
+
         logger.debug(
             "Creating VectorDatabase with pdf_root_path=%s, chroma_path=%s",
             pdf_root_path,
             chroma_path,
         )
 
-        return VectorDatabase(
+        vector_db = VectorDatabase(
             pdf_root_path=pdf_root_path,
             chroma_path=chroma_path,
             embedding_model=vdb_params["embedding_model"],
+            embedding_backend=vdb_params["embedding_backend"],
             collection_name=vdb_params["collection_name"],
             chunk_size=vdb_params["chunk_size"],
             chunk_overlap=vdb_params["chunk_overlap"],
+            encode_batch_size=vdb_params["encode_batch_size"],
+            hnsw_m=vdb_params["hnsw_m"],
+            hnsw_ef_construction=vdb_params["hnsw_ef_construction"],
+            hnsw_ef_search=vdb_params["hnsw_ef_search"],
         )
+        _VECTOR_DB_CACHE[cache_key] = vector_db
+        return vector_db
 
     def build_index(self) -> None:
         """
@@ -1,38 +1,99 @@
+import hashlib
+import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any
 import chromadb
+import numpy as np
 import tiktoken
 from sentence_transformers import SentenceTransformer
 
+try:
+    # Optional on-disk cache so index rebuilds only re-embed new or
+    # changed chunks.
+    import diskcache
+
+    _DISKCACHE_AVAILABLE = True
+except ImportError:
+    diskcache = None
+    _DISKCACHE_AVAILABLE = False
+
 from src.pdf_parser.pdf_parser import PdfTextExtractor
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str):
+    # tiktoken.get_encoding does a registry lookup and may reload BPE
+    # merges; chunk_text runs once per PDF, so load each encoder once.
+    return tiktoken.get_encoding(encoding_name)
+
+
 class VectorDatabase:
+    # Documents per collection.add call during index builds.
+    _ADD_BATCH_SIZE = 5000
+
+    # Below this many chunks, spawning encode workers (each loading its
+    # own model copy) costs more than it saves.
+    _MULTI_PROCESS_MIN_TEXTS = 2000
+
     def __init__(
         self,
         pdf_root_path: Path,
         chroma_path: Path,
         embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2",
+        embedding_backend: str = "torch",
         collection_name: str = "articles",
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
         token_encoding: str = "cl100k_base",
+        encode_batch_size: int = 256,
+        hnsw_m: int = 24,
+        hnsw_ef_construction: int = 128,
+        hnsw_ef_search: int = 100,
     ) -> None:
         self.pdf_root_path = pdf_root_path
         self.chroma_path = chroma_path
 
         self.embedding_model = embedding_model
+        self.embedding_backend = embedding_backend
         self.collection_name = collection_name
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.token_encoding = token_encoding
+        self.encode_batch_size = encode_batch_size
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.hnsw_ef_search = hnsw_ef_search
 
         self._model = None
         self._client = None
         self._collection = None
+        self._embed_cache = None
+        # Start loading the embedding model immediately: the 1-3s
+        # SentenceTransformer init overlaps PDF discovery / user idle
+        # time instead of blocking the first query.
+        self._model_ready = threading.Event()
+        threading.Thread(
+            target=self._load_model_bg,
+            name="embedding-model-loader",
+            daemon=True,
+        ).start()
+        self._chunk_manifest = None
+        self._encode_pool = None
+        # In-memory LRU of query embeddings; repeated queries skip the
+        # model forward pass entirely. The MCP server calls into one
+        # shared instance from several worker threads, so access is
+        # serialized by a lock.
+        self._query_cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._query_cache_maxsize = 256
+        self._query_cache_lock = threading.Lock()
 
     @staticmethod
     def chunk_text(
@@ -51,37 +112,283 @@ class VectorDatabase:
         if overlap >= chunk_size:
             raise ValueError("overlap must be < chunk_size")
 
-        enc = tiktoken.get_encoding(encoding_name)
+        enc = _get_encoding(encoding_name)
         tokens = enc.encode(text)
 
-        chunks: List[str] = []
-        start = 0
         n = len(tokens)
         step = chunk_size - overlap
 
-        while start < n:
-            end = min(start + chunk_size, n)
-            chunk_tokens = tokens[start:end]
-            chunk = enc.decode(chunk_tokens).strip()
-            if chunk:
-                chunks.append(chunk)
-            start += step
+        # decode_batch crosses into the Rust tokenizer once for all
+        # windows instead of once per chunk.
+        windows = [tokens[start : start + chunk_size] for start in range(0, n, step)]
+        decoded = enc.decode_batch(windows)
+
+        return [chunk for chunk in (d.strip() for d in decoded) if chunk]
 
-        return chunks
+    def _load_model(self) -> SentenceTransformer:
+        logger.info(
+            "Loading embedding model: %s (backend=%s) ...",
+            self.embedding_model,
+            self.embedding_backend,
+        )
+
+        if self.embedding_backend == "torch":
+            return SentenceTransformer(self.embedding_model)
+
+        model_kwargs = None
+        if self.embedding_backend == "onnx":
+            # Prefer the int8-quantized export: 2-3x faster on CPU for
+            # MiniLM at negligible recall loss.
+            model_kwargs = {
+                "file_name": "onnx/model_qint8_avx512_vnni.onnx",
+                "provider": "CPUExecutionProvider",
+            }
+
+        try:
+            return SentenceTransformer(
+                self.embedding_model,
+                backend=self.embedding_backend,
+                model_kwargs=model_kwargs,
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to load embedding model with backend '%s' (%s); "
+                "falling back to the default torch backend. "
+                "Run `pip install sentence-transformers[onnx]` to enable ONNX.",
+                self.embedding_backend,
+                e,
+            )
+            return SentenceTransformer(self.embedding_model)
+
+    def _load_model_bg(self) -> None:
+        try:
+            self._model = self._load_model()
+        except Exception:  # pragma: no cover - defensive
+            logger.exception(
+                "Background embedding-model load failed; "
+                "the first caller will retry synchronously."
+            )
+        finally:
+            self._model_ready.set()
 
     def _ensure_model(self) -> None:
+        if self._model is not None:
+            return
+
+        # Wait for the warm-load kicked off in __init__; by the time the
+        # first query or build reaches this point the load has usually
+        # already finished in the background.
+        self._model_ready.wait()
         if self._model is None:
-            logger.info("Loading embedding model: %s ...", self.embedding_model)
-            self._model = SentenceTransformer(self.embedding_model)
+            self._model = self._load_model()
+
+    def _ensure_embed_cache(self):
+        """
+        Open (once) the on-disk chunk-embedding cache, or return None when
+        diskcache is not installed.
+        """
+        if not _DISKCACHE_AVAILABLE:
+            return None
+        if self._embed_cache is None:
+            cache_dir = self.chroma_path / "_embed_cache"
+            logger.debug("Opening embedding cache at %s", cache_dir)
+            self._embed_cache = diskcache.Cache(str(cache_dir))
+        return self._embed_cache
+
+    def _encode_sorted(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode `texts` sorted by length, then un-permute the result.
+
+        encode pads every batch to its longest member, so feeding chunks
+        in filesystem order (short and long mixed) wastes compute;
+        grouping similar lengths keeps the padding tight.
+        """
+        order = np.argsort([len(text) for text in texts])
+        sorted_texts = [texts[i] for i in order]
+        if self._encode_pool is not None:
+            # Shards across the worker processes started by build_index;
+            # each shard still benefits from the length sort.
+            sorted_emb = self._model.encode_multi_process(
+                sorted_texts,
+                self._encode_pool,
+                batch_size=self.encode_batch_size,
+            )
+        else:
+            sorted_emb = self._model.encode(
+                sorted_texts,
+                batch_size=self.encode_batch_size,
+                show_progress_bar=True,
+                convert_to_numpy=True,
+            )
+        embeddings = np.empty_like(sorted_emb)
+        embeddings[order] = sorted_emb
+        return embeddings
+
+    def _embed_cache_key(self, text: str) -> str:
+        # Keyed by chunk content and model, so model swaps invalidate.
+        # The trailing tag versions the stored dtype (float16).
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{digest}|{self.embedding_model}|f16"
+
+    def _encode_chunks(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed `texts`, deduplicating identical chunks first: overlapping
+        windows and boilerplate (headers, author lists) repeat across
+        PDFs, and each duplicate would otherwise be embedded again.
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) == len(texts):
+            return self._encode_unique(texts)
+
+        logger.info(
+            "Deduplicated %d chunks to %d unique texts before embedding.",
+            len(texts),
+            len(unique_texts),
+        )
+        index_of = {text: i for i, text in enumerate(unique_texts)}
+        unique_emb = self._encode_unique(unique_texts)
+        gather = np.fromiter(
+            (index_of[text] for text in texts), dtype=np.intp, count=len(texts)
+        )
+        return unique_emb[gather]
+
+    def _encode_unique(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed `texts`, reusing cached vectors for chunks seen in earlier
+        builds. Vectors are persisted as raw float16 bytes, which is far
+        more compact than pickled Python lists.
+        """
+        cache = self._ensure_embed_cache()
+        if cache is None:
+            return self._encode_sorted(texts)
+
+        keys = [self._embed_cache_key(text) for text in texts]
+        cached = [cache.get(key) for key in keys]
+        miss_indices = [i for i, blob in enumerate(cached) if blob is None]
+
+        logger.info(
+            "Embedding cache: %d hits, %d misses.",
+            len(texts) - len(miss_indices),
+            len(miss_indices),
+        )
+
+        if miss_indices:
+            fresh = self._encode_sorted(
+                [texts[i] for i in miss_indices]
+            ).astype(np.float32, copy=False)
+            # Persist as float16: halves the cache footprint, and under
+            # cosine similarity the precision loss is far below MiniLM's
+            # own noise floor.
+            for row, i in enumerate(miss_indices):
+                cache.set(keys[i], fresh[row].astype(np.float16).tobytes())
+            dim = fresh.shape[1]
+        else:
+            dim = len(cached[0]) // np.dtype(np.float16).itemsize
+
+        embeddings = np.empty((len(texts), dim), dtype=np.float32)
+        row = 0
+        for i, blob in enumerate(cached):
+            if blob is None:
+                embeddings[i] = fresh[row]
+                row += 1
+            else:
+                embeddings[i] = np.frombuffer(blob, dtype=np.float16)
+        return embeddings
 
     def _ensure_collection(self) -> None:
         if self._client is None or self._collection is None:
             logger.info("Initializing Chroma at %s ...", self.chroma_path)
             self._client = chromadb.PersistentClient(path=str(self.chroma_path))
+            # Tuned HNSW parameters (applied at collection creation time;
+            # existing collections keep whatever they were created with).
             self._collection = self._client.get_or_create_collection(
-                name=self.collection_name
+                name=self.collection_name,
+                metadata={
+                    "hnsw:space": "cosine",
+                    "hnsw:M": self.hnsw_m,
+                    "hnsw:construction_ef": self.hnsw_ef_construction,
+                    "hnsw:search_ef": self.hnsw_ef_search,
+                },
             )
 
+    def _collect_pdf_jobs(self) -> List[tuple]:
+        """
+        Return (area, pdf_path) pairs for every PDF under the root.
+
+        Uses os.scandir rather than iterdir/glob: DirEntry carries the
+        type information from the directory listing itself, avoiding an
+        extra stat per entry — noticeable on large or networked corpora.
+        """
+        jobs: List[tuple] = []
+        with os.scandir(self.pdf_root_path) as it:
+            area_entries = sorted(
+                (entry for entry in it if entry.is_dir()),
+                key=lambda entry: entry.name,
+            )
+        for area_entry in area_entries:
+            with os.scandir(area_entry.path) as it:
+                pdf_names = sorted(
+                    entry.name for entry in it if entry.name.endswith(".pdf")
+                )
+            jobs.extend(
+                (area_entry.name, Path(area_entry.path) / name)
+                for name in pdf_names
+            )
+        return jobs
+
+    @staticmethod
+    def _extract_pdf_texts(jobs: List[tuple]) -> List[str | None]:
+        """
+        Extract text for each (area, pdf_path) job, in job order, with
+        None marking failures (already logged, mirroring the previous
+        inline error handling).
+
+        Extraction is CPU-bound and independent per document, so multiple
+        PDFs fan out across a process pool; chunking and metadata assembly
+        stay serial in the caller.
+        """
+        texts: List[str | None] = [None] * len(jobs)
+
+        def _record(index: int, future) -> None:
+            _, pdf_path = jobs[index]
+            error = future.exception()
+            if error is not None:
+                logger.error(
+                    "  [ERROR] Failed to extract text from %s: %s",
+                    pdf_path,
+                    error,
+                )
+            else:
+                texts[index] = future.result()
+
+        if len(jobs) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    futures = {
+                        executor.submit(PdfTextExtractor.extract, pdf_path): index
+                        for index, (_, pdf_path) in enumerate(jobs)
+                    }
+                    for future in as_completed(futures):
+                        _record(futures[future], future)
+                return texts
+            except Exception:
+                logger.exception(
+                    "Parallel PDF extraction failed; "
+                    "falling back to serial extraction."
+                )
+                texts = [None] * len(jobs)
+
+        for index, (_, pdf_path) in enumerate(jobs):
+            try:
+                texts[index] = PdfTextExtractor.extract(pdf_path)
+            except Exception as e:
+                logger.error(
+                    "  [ERROR] Failed to extract text from %s: %s",
+                    pdf_path,
+                    e,
+                )
+        return texts
+
     def build_index(self) -> None:
         self._ensure_model()
         self._ensure_collection()
@@ -89,80 +396,218 @@ class VectorDatabase:
         all_ids: List[str] = []
         all_texts: List[str] = []
         all_metadatas: List[Dict[str, Any]] = []
+        chunk_counts: Dict[str, int] = dict(self._load_chunk_manifest())
 
         logger.info("Reading PDFs from %s ...", self.pdf_root_path)
         if not self.pdf_root_path.exists():
             logger.error("PDF root path does not exist: %s", self.pdf_root_path)
             return
 
-        for area_dir in sorted(self.pdf_root_path.iterdir()):
-            if not area_dir.is_dir():
+        # PDFs whose (mtime, size) signature matches the last successful
+        # ingest and whose chunks are already in the collection are
+        # skipped outright — an incremental rebuild with one new PDF only
+        # extracts and embeds that PDF.
+        old_state = self._load_ingest_state()
+        new_state: Dict[str, list] = {}
+
+        jobs = []
+        skipped = 0
+        for area, pdf_path in self._collect_pdf_jobs():
+            st = pdf_path.stat()
+            signature = [st.st_mtime_ns, st.st_size]
+            article_id = f"{area}_{pdf_path.stem}"
+            if (
+                old_state.get(str(pdf_path)) == signature
+                and self._article_indexed(article_id)
+            ):
+                new_state[str(pdf_path)] = signature
+                skipped += 1
+                continue
+            jobs.append((area, pdf_path, signature))
+
+        logger.info(
+            "Found %d PDFs to extract (%d unchanged, skipped).",
+            len(jobs),
+            skipped,
+        )
+        extracted = self._extract_pdf_texts([(area, path) for area, path, _ in jobs])
+
+        for (area, pdf_path, signature), text in zip(jobs, extracted):
+            logger.info("  [PDF] %s (area: %s)", pdf_path, area)
+
+            if text is None:
                 continue
 
-            area = area_dir.name
-            logger.info("Processing area: %s", area)
-
-            for pdf_path in sorted(area_dir.glob("*.pdf")):
-                logger.info("  [PDF] %s", pdf_path)
-
-                try:
-                    text = PdfTextExtractor.extract(pdf_path)
-                except Exception as e:
-                    logger.error(
-                        "  [ERROR] Failed to extract text from %s: %s",
-                        pdf_path,
-                        e,
-                    )
-                    continue
-
-                chunks = self.chunk_text(
-                    text,
-                    chunk_size=self.chunk_size,
-                    overlap=self.chunk_overlap,
-                    encoding_name=self.token_encoding,
+            chunks = self.chunk_text(
+                text,
+                chunk_size=self.chunk_size,
+                overlap=self.chunk_overlap,
+                encoding_name=self.token_encoding,
+            )
+
+            if not chunks:
+                logger.warning(
+                    "  [WARN] No chunks generated from %s, skipping.",
+                    pdf_path,
                 )
+                continue
 
-                if not chunks:
-                    logger.warning(
-                        "  [WARN] No chunks generated from %s, skipping.",
-                        pdf_path,
-                    )
-                    continue
-
-                article_id = f"{area}_{pdf_path.stem}"
-                title = pdf_path.stem.replace("_", " ")
-
-                for idx, chunk in enumerate(chunks):
-                    doc_id = f"{article_id}_{idx}"
-                    all_ids.append(doc_id)
-                    all_texts.append(chunk)
-                    all_metadatas.append(
-                        {
-                            "area": area,
-                            "source_pdf": pdf_path.name,
-                            "chunk_index": idx,
-                            "article_id": article_id,
-                            "title": title,
-                        }
-                    )
+            article_id = f"{area}_{pdf_path.stem}"
+            title = pdf_path.stem.replace("_", " ")
+            chunk_counts[article_id] = len(chunks)
+            new_state[str(pdf_path)] = signature
+
+            for idx, chunk in enumerate(chunks):
+                doc_id = f"{article_id}_{idx}"
+                all_ids.append(doc_id)
+                all_texts.append(chunk)
+                all_metadatas.append(
+                    {
+                        "area": area,
+                        "source_pdf": pdf_path.name,
+                        "chunk_index": idx,
+                        "article_id": article_id,
+                        "title": title,
+                    }
+                )
 
         if not all_texts:
-            logger.warning("No chunks to index. Please check your PDFs.")
+            if skipped:
+                self._write_ingest_state(new_state)
+                logger.info("Index already up to date; nothing to embed.")
+            else:
+                logger.warning("No chunks to index. Please check your PDFs.")
             return
 
-        logger.info("Generating embeddings for %d chunks...", len(all_texts))
-        embeddings = self._model.encode(all_texts, show_progress_bar=True).tolist()
-
-        logger.info("Writing to '%s' collection...", self.collection_name)
-        self._collection.add(
-            ids=all_ids,
-            documents=all_texts,
-            embeddings=embeddings,
-            metadatas=all_metadatas,
+        logger.info(
+            "Embedding and writing %d chunks to '%s'...",
+            len(all_texts),
+            self.collection_name,
         )
+        # Encode and insert slice by slice rather than embedding the whole
+        # corpus first: peak memory holds one slice of embeddings instead
+        # of the full matrix, Chroma never sees one giant transaction, and
+        # progress survives a crash mid-build. Chroma accepts ndarrays
+        # directly; converting to nested Python lists would allocate one
+        # PyFloat per dimension per chunk.
+        # Large builds shard encoding across sentence-transformers' own
+        # multi-process pool (one worker per CPU core / GPU); the pool
+        # lives for the whole build so its startup cost is paid once.
+        if len(all_texts) >= self._MULTI_PROCESS_MIN_TEXTS:
+            try:
+                self._encode_pool = self._model.start_multi_process_pool()
+                logger.info("Started multi-process encode pool.")
+            except Exception as e:
+                logger.warning(
+                    "Could not start multi-process encode pool (%s); "
+                    "encoding in-process.",
+                    e,
+                )
+                self._encode_pool = None
+
+        try:
+            batch = self._ADD_BATCH_SIZE
+            for i in range(0, len(all_ids), batch):
+                embeddings = self._encode_chunks(all_texts[i : i + batch]).astype(
+                    np.float32, copy=False
+                )
+                self._collection.add(
+                    ids=all_ids[i : i + batch],
+                    documents=all_texts[i : i + batch],
+                    embeddings=embeddings,
+                    metadatas=all_metadatas[i : i + batch],
+                )
+                logger.info(
+                    "Indexed %d/%d chunks.",
+                    min(i + batch, len(all_ids)),
+                    len(all_ids),
+                )
+        finally:
+            if self._encode_pool is not None:
+                pool, self._encode_pool = self._encode_pool, None
+                self._model.stop_multi_process_pool(pool)
+
+        self._write_chunk_manifest(chunk_counts)
+        self._chunk_manifest = chunk_counts
+        self._write_ingest_state(new_state)
 
         logger.info("Chroma index built successfully with %d documents.", len(all_ids))
 
+    def _ingest_state_path(self) -> Path:
+        return self.chroma_path / "_ingest_state.json"
+
+    def _load_ingest_state(self) -> Dict[str, list]:
+        try:
+            with self._ingest_state_path().open("r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_ingest_state(self, state: Dict[str, list]) -> None:
+        # Temp-write + rename so a crash never leaves a torn state file.
+        path = self._ingest_state_path()
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp, path)
+        except OSError as e:  # pragma: no cover - defensive
+            logger.warning("Could not write ingest state: %s", e)
+
+    def _article_indexed(self, article_id: str) -> bool:
+        try:
+            res = self._collection.get(ids=[f"{article_id}_0"], include=[])
+            return bool(res.get("ids"))
+        except Exception:  # pragma: no cover - defensive
+            return False
+
+    def _chunk_manifest_path(self) -> Path:
+        return self.chroma_path / "article_chunks.json"
+
+    def _write_chunk_manifest(self, chunk_counts: Dict[str, int]) -> None:
+        """
+        Persist the per-article chunk counts so lookups can enumerate
+        chunk IDs directly instead of scanning metadata.
+        """
+        try:
+            with self._chunk_manifest_path().open("w", encoding="utf-8") as f:
+                json.dump(chunk_counts, f)
+        except OSError as e:  # pragma: no cover - defensive
+            logger.warning("Could not write chunk manifest: %s", e)
+
+    def _load_chunk_manifest(self) -> Dict[str, int]:
+        if self._chunk_manifest is None:
+            try:
+                with self._chunk_manifest_path().open("r", encoding="utf-8") as f:
+                    self._chunk_manifest = json.load(f)
+            except (OSError, ValueError):
+                # Index predates the manifest (or it is unreadable);
+                # lookups fall back to the metadata scan.
+                self._chunk_manifest = {}
+        return self._chunk_manifest
+
+    def _embed_query(self, query: str) -> np.ndarray:
+        """
+        Embed a single query, memoized in an LRU keyed by (model, query)
+        so identical repeated queries cost a dict lookup instead of a
+        model forward pass.
+        """
+        key = (self.embedding_model, query)
+        with self._query_cache_lock:
+            vec = self._query_cache.get(key)
+            if vec is not None:
+                self._query_cache.move_to_end(key)
+                return vec
+
+        # The forward pass runs outside the lock: two threads racing on
+        # the same cold query just duplicate a cheap encode.
+        vec = self._model.encode([query], convert_to_numpy=True)[0]
+        with self._query_cache_lock:
+            self._query_cache[key] = vec
+            if len(self._query_cache) > self._query_cache_maxsize:
+                self._query_cache.popitem(last=False)
+        return vec
+
     def search_articles(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         if not query.strip():
             logger.error("Query must not be empty.")
@@ -172,7 +617,7 @@ class VectorDatabase:
         self._ensure_collection()
 
         logger.debug("Running vector search for query: %s", query)
-        query_embedding = self._model.encode([query]).tolist()
+        query_embedding = self._embed_query(query).reshape(1, -1)
 
         raw = self._collection.query(
             query_embeddings=query_embedding,
@@ -183,46 +628,107 @@ class VectorDatabase:
         metadatas = raw.get("metadatas", [[]])[0]
         distances = raw.get("distances", [[]])[0]
 
+        return self._aggregate_hits(metadatas, distances, top_k)
+
+    def search_articles_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Batched variant of `search_articles`.
+
+        Embeds all queries in one `encode` call (much better matmul
+        utilization than one-at-a-time) and issues a single multi-query
+        Chroma request. Returns one result list per input query.
+        """
+        if not queries:
+            return []
+        if any(not q.strip() for q in queries):
+            logger.error("Queries must not be empty.")
+            raise ValueError("Queries must not be empty.")
+
+        self._ensure_model()
+        self._ensure_collection()
+
+        logger.debug("Running batched vector search for %d queries.", len(queries))
+        query_embeddings = self._model.encode(
+            queries, batch_size=32, convert_to_numpy=True
+        )
+
+        raw = self._collection.query(
+            query_embeddings=query_embeddings,
+            n_results=top_k * 3,
+            include=["metadatas", "distances"],
+        )
+
+        all_metadatas = raw.get("metadatas", [])
+        all_distances = raw.get("distances", [])
+
+        return [
+            self._aggregate_hits(metadatas, distances, top_k)
+            for metadatas, distances in zip(all_metadatas, all_distances)
+        ]
+
+    @staticmethod
+    def _aggregate_hits(
+        metadatas: List[Dict[str, Any]],
+        distances: List[float],
+        top_k: int,
+    ) -> List[Dict[str, Any]]:
         if not metadatas:
             logger.info("No results returned from vector search.")
             return []
 
-        scored_chunks: List[Dict[str, Any]] = []
-        for meta, dist in zip(metadatas, distances):
-            score = 1.0 / (1.0 + float(dist))
-            scored_chunks.append(
-                {
-                    "article_id": meta["article_id"],
-                    "title": meta.get("title") or meta.get("source_pdf"),
-                    "area": meta["area"],
-                    "score": score,
-                }
-            )
+        # One vectorized pass over the distances; visiting chunks in
+        # descending score order means the first chunk seen per article is
+        # its best one, and results come out already sorted — no second
+        # aggregation loop and no final sort.
+        #
+        # The collection uses cosine space, where Chroma's distance is
+        # 1 - cos, so (1 + cos) / 2 maps it straight onto [0, 1]: 1.0 is
+        # an identical direction, 0.5 orthogonal. The old 1 / (1 + d)
+        # squashed everything into (0.33, 1] and hid the metric.
+        scores = 1.0 - 0.5 * np.asarray(distances, dtype=np.float32)
+        order = np.argsort(-scores)
 
         by_article: Dict[str, Dict[str, Any]] = {}
-        for chunk in scored_chunks:
-            aid = chunk["article_id"]
-            current = by_article.get(aid)
-            if current is None or chunk["score"] > current["score"]:
-                by_article[aid] = {
-                    "id": aid,
-                    "title": chunk["title"],
-                    "area": chunk["area"],
-                    "score": chunk["score"],
-                }
-
-        results = sorted(by_article.values(), key=lambda x: x["score"], reverse=True)
+        for i in order:
+            meta = metadatas[i]
+            aid = meta["article_id"]
+            if aid in by_article:
+                continue
+            by_article[aid] = {
+                "id": aid,
+                "title": meta.get("title") or meta.get("source_pdf"),
+                "area": meta["area"],
+                "score": float(scores[i]),
+            }
+            if len(by_article) == top_k:
+                break
+
+        results = list(by_article.values())
         logger.debug("Vector search returned %d aggregated articles.", len(results))
-        return results[:top_k]
+        return results
 
     def get_article_content(self, article_id: str) -> Dict[str, Any]:
         self._ensure_collection()
 
         logger.debug("Fetching article content for id=%s", article_id)
-        res = self._collection.get(
-            where={"article_id": article_id},
-            include=["documents", "metadatas"],
-        )
+        # Chunk IDs are deterministic ("{article_id}_{idx}"), so when the
+        # build manifest knows the chunk count we fetch by primary key
+        # instead of forcing Chroma to scan every document's metadata.
+        num_chunks = self._load_chunk_manifest().get(article_id)
+        if num_chunks:
+            res = self._collection.get(
+                ids=[f"{article_id}_{i}" for i in range(num_chunks)],
+                include=["documents", "metadatas"],
+            )
+        else:
+            res = self._collection.get(
+                where={"article_id": article_id},
+                include=["documents", "metadatas"],
+            )
 
         documents = res.get("documents", [])
         metadatas = res.get("metadatas", [])
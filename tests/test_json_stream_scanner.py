@@ -0,0 +1,93 @@
+# tests/test_json_stream_scanner.py
+import json
+import os
+
+# The extractor module builds its ChatGroq client at import time; a dummy
+# key keeps the import self-contained. No test here ever calls the LLM.
+os.environ.setdefault("GROQ_API_KEY", "test-key")
+
+from src.multi_agent_system.agents.extractor import (  # noqa: E402
+    ExtractorAgent,
+    _JsonStreamScanner,
+)
+
+
+def _feed_in_pieces(scanner: _JsonStreamScanner, text: str, size: int = 5):
+    """Feed `text` in small chunks, mimicking a streamed response."""
+    pieces = [text[i : i + size] for i in range(0, len(text), size)]
+    fed = []
+    for piece in pieces:
+        fed.append(piece)
+        if scanner.feed(piece):
+            break
+    return fed
+
+
+def test_scanner_bare_object_with_surrounding_prose():
+    text = 'Sure, here you go: {"a": 1, "b": [2, 3]} hope that helps!'
+    scanner = _JsonStreamScanner()
+    _feed_in_pieces(scanner, text)
+
+    assert scanner.start >= 0
+    assert scanner.end >= scanner.start
+    sliced = text[scanner.start : scanner.end + 1]
+    assert json.loads(sliced) == {"a": 1, "b": [2, 3]}
+
+
+def test_scanner_fenced_object():
+    inner = '{"outer": {"inner": 2}}'
+    text = f"```json\n{inner}\n```"
+    scanner = _JsonStreamScanner()
+    _feed_in_pieces(scanner, text)
+
+    assert text[scanner.start : scanner.end + 1] == inner
+    assert json.loads(text[scanner.start : scanner.end + 1]) == {
+        "outer": {"inner": 2}
+    }
+
+
+def test_scanner_ignores_braces_and_escapes_inside_strings():
+    text = '{"text": "brace } inside \\" quote {", "n": 1}'
+    scanner = _JsonStreamScanner()
+    # One char at a time: every string/escape state transition crosses a
+    # chunk boundary.
+    _feed_in_pieces(scanner, text, size=1)
+
+    assert text[scanner.start : scanner.end + 1] == text
+    assert json.loads(text) == {"text": 'brace } inside " quote {', "n": 1}
+
+
+def test_scanner_no_json_never_completes():
+    scanner = _JsonStreamScanner()
+    assert scanner.feed("no json object in this text at all") is False
+    assert scanner.start == -1
+    assert scanner.end == -1
+
+
+def test_scanner_stops_before_trailing_garbage():
+    text = '{"a": 1}' + " trailing garbage" * 10
+    scanner = _JsonStreamScanner()
+    fed = _feed_in_pieces(scanner, text, size=4)
+
+    # The stream is abandoned as soon as the object closes.
+    assert len("".join(fed)) < len(text)
+    assert text[scanner.start : scanner.end + 1] == '{"a": 1}'
+
+
+def test_streamed_content_slices_exact_span():
+    chunks = ['noise {"a"', ": 1} tail"]
+    scanner = _JsonStreamScanner()
+    for chunk in chunks:
+        if scanner.feed(chunk):
+            break
+
+    assert ExtractorAgent._streamed_content(chunks, scanner) == '{"a": 1}'
+
+
+def test_streamed_content_falls_back_to_full_buffer():
+    chunks = ["no json", " here"]
+    scanner = _JsonStreamScanner()
+    for chunk in chunks:
+        scanner.feed(chunk)
+
+    assert ExtractorAgent._streamed_content(chunks, scanner) == "no json here"
@@ -0,0 +1,58 @@
+# tests/test_tokenization.py
+from src.multi_agent_system._tokenization import get_encoder, truncate_by_tokens
+
+
+def test_empty_and_nonpositive_budget():
+    assert truncate_by_tokens("", 100) == ""
+    assert truncate_by_tokens("some text", 0) == ""
+    assert truncate_by_tokens("some text", -5) == ""
+
+
+def test_short_text_returned_unchanged():
+    text = "short text well under the budget"
+    # Any text within max_tokens * 2 chars can never exceed the cap.
+    assert truncate_by_tokens(text, max_tokens=len(text)) is text
+
+
+def test_non_strict_truncates_on_word_boundary():
+    text = "word " * 1000
+    max_tokens = 10
+
+    result = truncate_by_tokens(text, max_tokens=max_tokens)
+
+    assert text.startswith(result)
+    # Caps at ~3.5 chars per token and never cuts mid-word.
+    assert len(result) <= int(max_tokens * 3.5)
+    assert text[len(result)] == " "
+
+
+def test_strict_respects_exact_token_budget():
+    text = "hello world, this sentence repeats itself. " * 200
+    max_tokens = 10
+
+    result = truncate_by_tokens(text, max_tokens=max_tokens, strict_tokens=True)
+
+    enc = get_encoder()
+    assert len(enc.encode_ordinary(result)) <= max_tokens
+    assert text.startswith(result)
+
+
+def test_strict_truncates_cjk_text():
+    # CJK runs at one or more tokens per character, so the Latin-centric
+    # chars-per-token shortcut must not skip tokenization in strict mode.
+    text = "春眠不覚暁処処聞啼鳥" * 50
+    max_tokens = 10
+
+    result = truncate_by_tokens(text, max_tokens=max_tokens, strict_tokens=True)
+
+    enc = get_encoder()
+    assert len(enc.encode_ordinary(result)) <= max_tokens
+    assert len(result) < len(text)
+
+
+def test_strict_returns_text_within_budget_unchanged():
+    text = "a few tokens only " * 20  # long enough to skip the char preflight
+    enc = get_encoder()
+    budget = len(enc.encode_ordinary(text)) + 1
+
+    assert truncate_by_tokens(text, max_tokens=budget, strict_tokens=True) == text
@@ -1,8 +1,11 @@
 # tests/test_vector_database.py
+import os
 from pathlib import Path
 
+import numpy as np
 import pytest
 
+from src.vector_database import vector_database as vdb_module
 from src.vector_database.vector_database import VectorDatabase
 
 
@@ -86,3 +89,145 @@ def test_get_article_content_roundtrip():
     assert article["id"] == article_id
     assert isinstance(article["content"], str)
     assert len(article["content"].strip()) > 0
+
+def _meta(article_id: str) -> dict:
+    return {"article_id": article_id, "title": article_id, "area": "tech"}
+
+
+def test_aggregate_hits_orders_dedupes_and_scores():
+    # Article A appears twice; its best (closest) chunk must win, and
+    # results must come out sorted by score.
+    metadatas = [_meta("A"), _meta("B"), _meta("A")]
+    distances = [0.8, 0.2, 0.4]
+
+    results = VectorDatabase._aggregate_hits(metadatas, distances, top_k=5)
+
+    assert [r["id"] for r in results] == ["B", "A"]
+    # Cosine space: score = (1 + cos) / 2 = 1 - distance / 2.
+    assert results[0]["score"] == pytest.approx(0.9)
+    assert results[1]["score"] == pytest.approx(0.8)
+
+
+def test_aggregate_hits_respects_top_k():
+    metadatas = [_meta("A"), _meta("B"), _meta("C")]
+    distances = [0.3, 0.1, 0.2]
+
+    results = VectorDatabase._aggregate_hits(metadatas, distances, top_k=1)
+
+    assert [r["id"] for r in results] == ["B"]
+
+
+def test_aggregate_hits_empty():
+    assert VectorDatabase._aggregate_hits([], [], top_k=3) == []
+
+
+class _FakeEncoder:
+    """Deterministic stand-in for SentenceTransformer.encode."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def encode(self, texts, **kwargs):
+        self.calls.append(list(texts))
+        return np.array(
+            [[len(t), t.count("a"), hash(t) % 97, 1.0] for t in texts],
+            dtype=np.float32,
+        )
+
+
+def _make_offline_vdb(tmp_path, monkeypatch) -> VectorDatabase:
+    """
+    Build a VectorDatabase that never loads a real model: the background
+    warm-load is replaced before construction so no thread touches
+    SentenceTransformer.
+    """
+    monkeypatch.setattr(
+        VectorDatabase,
+        "_load_model_bg",
+        lambda self: self._model_ready.set(),
+    )
+    vdb = VectorDatabase(
+        pdf_root_path=tmp_path / "pdfs",
+        chroma_path=tmp_path / "chroma",
+    )
+    vdb._model = _FakeEncoder()
+    return vdb
+
+
+@pytest.mark.skipif(
+    not vdb_module._DISKCACHE_AVAILABLE, reason="diskcache not installed"
+)
+def test_encode_unique_float16_cache_roundtrip(tmp_path, monkeypatch):
+    vdb = _make_offline_vdb(tmp_path, monkeypatch)
+    texts = ["first chunk", "second chunk", "a third, longer chunk"]
+
+    first = vdb._encode_unique(texts)
+    assert first.shape == (3, 4)
+    assert len(vdb._model.calls) == 1
+
+    # Second pass hits the cache for every chunk: no encode call, and the
+    # float16 round-trip stays within half-precision tolerance.
+    second = vdb._encode_unique(texts)
+    assert len(vdb._model.calls) == 1
+    assert second.dtype == np.float32
+    assert np.allclose(first, second, rtol=1e-2, atol=1e-3)
+
+
+class _FakeCollection:
+    def __init__(self) -> None:
+        self.added_ids = []
+
+    def add(self, ids, documents, embeddings, metadatas):
+        self.added_ids.extend(ids)
+
+    def get(self, ids=None, include=None, where=None):
+        if ids is not None:
+            return {"ids": [i for i in ids if i in self.added_ids]}
+        return {"ids": []}
+
+
+def _prepare_build(vdb: VectorDatabase, monkeypatch) -> dict:
+    """Stub out the model/collection/extraction layers around build_index."""
+    collection = _FakeCollection()
+    counters = {"extractions": 0, "collection": collection}
+
+    def _fake_extract(jobs):
+        counters["extractions"] += len(jobs)
+        return ["extracted text"] * len(jobs)
+
+    monkeypatch.setattr(vdb, "_ensure_model", lambda: None)
+    monkeypatch.setattr(vdb, "_ensure_collection", lambda: None)
+    monkeypatch.setattr(vdb, "_extract_pdf_texts", _fake_extract)
+    monkeypatch.setattr(vdb, "chunk_text", lambda text, **kwargs: ["one chunk"])
+    monkeypatch.setattr(
+        vdb,
+        "_encode_chunks",
+        lambda texts: np.zeros((len(texts), 4), dtype=np.float32),
+    )
+    vdb._collection = collection
+    return counters
+
+
+def test_build_index_skips_unchanged_pdfs(tmp_path, monkeypatch):
+    vdb = _make_offline_vdb(tmp_path, monkeypatch)
+    area_dir = vdb.pdf_root_path / "tech"
+    area_dir.mkdir(parents=True)
+    vdb.chroma_path.mkdir(parents=True)
+    pdf_path = area_dir / "paper.pdf"
+    pdf_path.write_bytes(b"%PDF-fake")
+
+    counters = _prepare_build(vdb, monkeypatch)
+
+    vdb.build_index()
+    assert counters["extractions"] == 1
+    assert counters["collection"].added_ids == ["tech_paper_0"]
+
+    # Unchanged file: the second build touches nothing.
+    vdb.build_index()
+    assert counters["extractions"] == 1
+
+    # Bump the mtime: the signature no longer matches, so it reprocesses.
+    stat = pdf_path.stat()
+    os.utime(pdf_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    vdb.build_index()
+    assert counters["extractions"] == 2